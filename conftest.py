@@ -0,0 +1,5 @@
+import os
+
+# Enable runtime type checking for the test suite. This must happen before
+# any pykada module is imported, since the decorator is chosen at import time.
+os.environ.setdefault("PYKADA_TYPECHECK", "1")
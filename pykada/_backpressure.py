@@ -0,0 +1,95 @@
+import functools
+import inspect
+import os
+import threading
+import typing
+from typing import Any, Callable, Optional
+
+# Maximum number of wrapped calls allowed in flight at once, across all
+# threads. Override with the PYKADA_MAX_INFLIGHT environment variable.
+DEFAULT_MAX_IN_FLIGHT = 8
+
+MAX_IN_FLIGHT = int(os.environ.get("PYKADA_MAX_INFLIGHT",
+                                   DEFAULT_MAX_IN_FLIGHT))
+
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+# Maps a single-flight key to [lock, number of callers using the lock]. The
+# entry is removed once no caller holds or waits on it.
+_key_locks: typing.Dict[Any, list] = {}
+_key_locks_guard = threading.Lock()
+
+
+def _acquire_key_lock(key: Any) -> threading.Lock:
+    with _key_locks_guard:
+        entry = _key_locks.get(key)
+        if entry is None:
+            entry = _key_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
+    return entry[0]
+
+
+def _release_key_lock(key: Any) -> None:
+    with _key_locks_guard:
+        entry = _key_locks[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _key_locks[key]
+
+
+def _call_in_slot(func: Callable, args: tuple, kwargs: dict,
+                  timeout: Optional[float]):
+    if not _in_flight.acquire(timeout=timeout):
+        raise TimeoutError("Timed out waiting for a free request slot")
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _in_flight.release()
+
+
+def with_backpressure(key: Optional[Callable[[dict], Any]] = None,
+                      timeout: Optional[float] = None):
+    """
+    Decorator that limits how many calls to mutating API methods are in
+    flight at once (see MAX_IN_FLIGHT), and optionally allows only one call
+    at a time per key, so concurrent callers don't swamp the server with
+    requests that end up rate limited and retried. The MAX_IN_FLIGHT limit
+    is shared by every decorated method in the process, so it also caps
+    batch helpers such as create_users regardless of their max_workers.
+
+    :param key: Optional function that receives the bound arguments of the
+        call (by parameter name) and returns the single-flight key, or None
+        to skip single-flight for that call.
+    :param timeout: Optional number of seconds to wait for a free slot
+        before giving up.
+    :raises TimeoutError: If a slot is not available within timeout.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            flight_key = None
+            if key is not None:
+                flight_key = key(signature.bind_partial(*args, **kwargs).arguments)
+
+            if flight_key is None:
+                return _call_in_slot(func, args, kwargs, timeout)
+
+            key_lock = _acquire_key_lock(flight_key)
+            try:
+                # Lock.acquire uses -1 rather than None to wait forever
+                if not key_lock.acquire(
+                        timeout=-1 if timeout is None else timeout):
+                    raise TimeoutError(
+                        f"Timed out waiting for in-flight call on {flight_key!r}")
+                try:
+                    return _call_in_slot(func, args, kwargs, timeout)
+                finally:
+                    key_lock.release()
+            finally:
+                _release_key_lock(flight_key)
+
+        return wrapper
+
+    return decorator
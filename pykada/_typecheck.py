@@ -0,0 +1,65 @@
+import functools
+import inspect
+import os
+import sys
+
+
+def _no_typecheck(func):
+    """
+    Returns the function unchanged. Used in place of typeguard's
+    @typechecked when runtime type checking is disabled.
+    """
+    return func
+
+
+# Runtime type checking walks every annotated argument on every call, which
+# adds up inside pagination loops. It is opt-in: set PYKADA_TYPECHECK=1
+# (the test suite does this in conftest.py) to enable typeguard checks, or
+# PYKADA_TYPECHECK=beartype to use beartype's much cheaper wrappers instead
+# (requires beartype to be installed). Checks are always off under python -O,
+# like assert statements.
+_TYPECHECK_SETTING = os.environ.get("PYKADA_TYPECHECK", "").lower()
+TYPECHECK_ENABLED = (not sys.flags.optimize
+                     and _TYPECHECK_SETTING not in ("", "0", "false", "no"))
+
+if TYPECHECK_ENABLED and _TYPECHECK_SETTING == "beartype":
+    try:
+        from beartype import beartype as typechecked
+        from beartype.roar import BeartypeCallHintViolation as TypeCheckError
+    except ImportError as e:
+        raise ImportError(
+            "PYKADA_TYPECHECK=beartype requires the beartype package to be "
+            "installed.") from e
+elif TYPECHECK_ENABLED:
+    @functools.lru_cache(maxsize=None)
+    def _instrumented(func):
+        from typeguard import typechecked as _typeguard_typechecked
+        return _typeguard_typechecked(func)
+
+    def typechecked(func):
+        """
+        Applies typeguard's @typechecked the first time func is called rather
+        than when it is decorated, so importing pykada neither imports
+        typeguard nor instruments every function up front.
+        """
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await _instrumented(func)(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return _instrumented(func)(*args, **kwargs)
+        return wrapper
+else:
+    typechecked = _no_typecheck
+
+
+def __getattr__(name):
+    # TypeCheckError resolves to typeguard's exception unless beartype is in
+    # use; it is looked up lazily so typeguard is only imported when needed.
+    if name == "TypeCheckError":
+        from typeguard import TypeCheckError
+        return TypeCheckError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,9 +19,9 @@ from pykada.endpoints import ACCESS_CARD_ENDPOINT, \
     ACCESS_REMOTE_UNLOCK_ACTIVATE_ENDPOINT, \
     ACCESS_REMOTE_UNLOCK_DEACTIVATE_ENDPOINT, ACCESS_START_DATE_ENDPOINT
 from pykada.helpers import check_user_external_id, remove_null_fields, \
-    require_non_empty_str, is_valid_date, is_valid_time
+    require_non_empty_str, is_valid_date, is_valid_time, USER_EXTERNAL_ID_ERROR
 from pykada.enums import WEEKDAY_ENUM, FREQUENCY_ENUM, DOOR_STATUS_ENUM, \
-    VALID_ACCESS_EVENT_TYPES_ENUM
+    VALID_ACCESS_EVENT_TYPES_ENUM, WEEKDAY_VALUES, DOOR_STATUS_VALUES
 from pykada.verkada_client import BaseClient
 from pykada.verkada_requests import VerkadaRequestManager
 
@@ -727,8 +727,7 @@ class AccessControlClient(BaseClient):
             raise ValueError("group_id must be a non-empty string")
         if (user_id is None and external_id is None) or (
                 user_id is not None and external_id is not None):
-            raise ValueError(
-                "Exactly one of user_id or external_id must be provided, not both or neither.")
+            raise ValueError(USER_EXTERNAL_ID_ERROR)
 
         params = {"group_id": group_id}
         payload = {"external_id": external_id, "user_id": user_id}
@@ -756,8 +755,7 @@ class AccessControlClient(BaseClient):
             raise ValueError("group_id must be a non-empty string")
         if (user_id is None and external_id is None) or (
                 user_id is not None and external_id is not None):
-            raise ValueError(
-                "Exactly one of user_id or external_id must be provided, not both or neither.")
+            raise ValueError(USER_EXTERNAL_ID_ERROR)
 
         params = {"group_id": group_id, "external_id": external_id,
                   "user_id": user_id}
@@ -926,7 +924,7 @@ class AccessControlClient(BaseClient):
         if not is_valid_time(start_time) or not is_valid_time(end_time):
             raise ValueError(
                 "start_time and end_time must be in HH:MM format (00:00 to 23:59) with required leading zeros")
-        if weekday not in WEEKDAY_ENUM.values():
+        if weekday not in WEEKDAY_VALUES:
             raise ValueError(
                 f"weekday must be one of the values in WEEKDAY_ENUM: {list(WEEKDAY_ENUM.values())}")
 
@@ -967,7 +965,7 @@ class AccessControlClient(BaseClient):
         if not is_valid_time(start_time) or not is_valid_time(end_time):
             raise ValueError(
                 "start_time and end_time must be in HH:MM format (00:00 to 23:59) with required leading zeros")
-        if weekday not in WEEKDAY_ENUM.values():
+        if weekday not in WEEKDAY_VALUES:
             raise ValueError(
                 f"weekday must be one of the values in WEEKDAY_ENUM: {list(WEEKDAY_ENUM.values())}")
 
@@ -2288,7 +2286,7 @@ def validate_recurrence_rule(rr: Dict[str, Any],
                 raise ValueError(
                     f"Exception at index {idx}: For MONTHLY or YEARLY frequency, 'by_day' must contain exactly one value")
         # Validate that each day is one of the allowed weekdays.
-        if not set(rr["by_day"]).issubset(set(WEEKDAY_ENUM.values())):
+        if not WEEKDAY_VALUES.issuperset(rr["by_day"]):
             raise ValueError(
                 f"Exception at index {idx}: 'by_day' values must be one of {list(WEEKDAY_ENUM.values())}")
 
@@ -2367,7 +2365,7 @@ def validate_door_exception(exc: Dict[str, Any],
         raise ValueError(
             f"Exception at index {idx}: 'door_status' is required")
     require_non_empty_str(exc["door_status"], "door_status", idx)
-    if exc["door_status"] not in list(DOOR_STATUS_ENUM.values()):
+    if exc["door_status"] not in DOOR_STATUS_VALUES:
         raise ValueError(
             f"Exception at index {idx}: 'door_status' must be one of {list(DOOR_STATUS_ENUM.values())}")
 
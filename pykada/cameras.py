@@ -1,13 +1,19 @@
 import base64
-from typing import List, Any, Generator
+import json
+from typing import List, Generator, Tuple
 
-from typeguard import typechecked
+from pykada._typecheck import typechecked
 
 from pykada.endpoints import *
-from pykada.helpers import remove_null_fields, verify_csv_columns, require_non_empty_str
+from pykada.helpers import remove_null_fields, verify_csv_columns, \
+    require_non_empty_str, run_concurrently, remove_null_fields_inplace
 from pykada.enums import VALID_OCCUPANCY_TRENDS_INTERVALS_ENUM, \
     VALID_OCCUPANCY_TRENDS_TYPES_ENUM, VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM, \
-    VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM
+    VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM, \
+    VALID_OCCUPANCY_TRENDS_INTERVALS_VALUES, \
+    VALID_OCCUPANCY_TRENDS_TYPES_VALUES, \
+    VALID_CLOUD_BACKUP_VIDEO_QUALITY_VALUES, \
+    VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_VALUES
 from pykada.verkada_client import BaseClient
 from pykada.verkada_requests import *
 
@@ -53,10 +59,9 @@ class CamerasClient(BaseClient):
                 "false" if include_image_url is False else None),
             "page_token": page_token,
             "page_size": page_size,
-            "notification_type": ",".join(map(str,
-                                              notification_type)) if notification_type else None,
+            "notification_type": ",".join(notification_type) if notification_type else None,
         }
-        params = remove_null_fields(params)
+        params = remove_null_fields_inplace(params)
         return self.request_manager.get(CAMERA_ALERTS_ENDPOINT, params=params)
 
     @typechecked
@@ -64,8 +69,11 @@ class CamerasClient(BaseClient):
                               start_time: Optional[int] = None,
                               end_time: Optional[int] = None,
                               include_image_url: Optional[bool] = None,
-                              notification_type: Optional[List[str]] = None):
+                              notification_type: Optional[List[str]] = None,
+                              limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
+        Lazily iterates through camera alerts across all pages.
 
         :param start_time: Start time for the data (Unix timestamp in seconds).
         :type start_time: int or None
@@ -73,8 +81,10 @@ class CamerasClient(BaseClient):
         :type end_time: int or None
         :param include_image_url:
         :param notification_type:
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of alert dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_camera_alerts(**kwargs),
@@ -83,7 +93,8 @@ class CamerasClient(BaseClient):
                 "end_time": end_time,
                 "include_image_url": include_image_url,
                 "notification_type": notification_type
-            }
+            },
+            limit=limit
         )
     
     @typechecked
@@ -100,16 +111,21 @@ class CamerasClient(BaseClient):
                    "description": description}
         return self.request_manager.post(LPOI_ENDPOINT, payload)
     
-    def get_all_lpois(self):
+    def get_all_lpois(self, limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
+        Lazily iterates through license plates of interest across all pages.
 
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of license plate of interest dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_lpois(**kwargs),
             items_key="license_plate_of_interest",
-            next_token_key="next_page_token"
+            next_token_key="next_page_token",
+            limit=limit
         )
     
     @typechecked
@@ -156,6 +172,47 @@ class CamerasClient(BaseClient):
         params = {"license_plate": license_plate}
         return self.request_manager.delete(LPOI_ENDPOINT, params=params)
 
+    @typechecked
+    def create_lpois_batch(self, entries: List[Tuple[str, str]],
+                           max_workers: int = 8) -> List[dict]:
+        """
+        Creates many License Plates of Interest, issuing the requests
+        concurrently instead of one after another.
+
+        :param entries: A list of (license_plate, description) pairs.
+        :param max_workers: The maximum number of requests in flight at once.
+        :return: The created LPOI objects, in the same order as entries.
+        """
+        return run_concurrently(self.create_lpoi, entries, max_workers)
+
+    @typechecked
+    def update_lpois_batch(self, entries: List[Tuple[str, str]],
+                           max_workers: int = 8) -> List[dict]:
+        """
+        Updates the descriptions of many License Plates of Interest, issuing
+        the requests concurrently instead of one after another.
+
+        :param entries: A list of (license_plate, description) pairs.
+        :param max_workers: The maximum number of requests in flight at once.
+        :return: The updated LPOI objects, in the same order as entries.
+        """
+        return run_concurrently(self.update_lpoi, entries, max_workers)
+
+    @typechecked
+    def delete_lpois_batch(self, license_plates: List[str],
+                           max_workers: int = 8) -> List[dict]:
+        """
+        Deletes many License Plates of Interest, issuing the requests
+        concurrently instead of one after another.
+
+        :param license_plates: The license plates to delete.
+        :param max_workers: The maximum number of requests in flight at once.
+        :return: The deleted LPOI objects, in the same order as license_plates.
+        """
+        return run_concurrently(self.delete_lpoi,
+                                [(plate,) for plate in license_plates],
+                                max_workers)
+
     @typechecked
     def create_bulk_lpois(self, filename: str) -> dict:
         """
@@ -211,7 +268,9 @@ class CamerasClient(BaseClient):
     def get_all_seen_license_plates(self, camera_id: str,
                                     license_plate: Optional[str] = None,
                                     start_time: Optional[int] = None,
-                                    end_time: Optional[int] = None):
+                                    end_time: Optional[int] = None,
+                                    limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
 
         :param camera_id:
@@ -222,8 +281,10 @@ class CamerasClient(BaseClient):
         :type start_time: int or None
         :param end_time: End time for the data (Unix timestamp in seconds).
         :type end_time: int or None
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of detection dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_seen_license_plates(**kwargs),
@@ -234,7 +295,8 @@ class CamerasClient(BaseClient):
                 "end_time": end_time
             },
             next_token_key="next_page_token",
-            items_key="detections"
+            items_key="detections",
+            limit=limit
         )
     
     @typechecked
@@ -261,7 +323,8 @@ class CamerasClient(BaseClient):
         :return:
         :rtype:
         """
-        require_non_empty_str(camera_id, "camera_id")
+        if not isinstance(camera_id, str) or not camera_id.strip():
+            raise ValueError("camera_id must be a non-empty string")
         params = {
             "camera_id": camera_id,
             "license_plate": license_plate,
@@ -270,7 +333,7 @@ class CamerasClient(BaseClient):
             "page_size": page_size,
             "page_token": page_token
         }
-        params = remove_null_fields(params)
+        params = remove_null_fields_inplace(params)
         return self.request_manager.get(LPR_PLATE_IMAGES_ENDPOINT, params=params)
 
     @typechecked
@@ -295,8 +358,10 @@ class CamerasClient(BaseClient):
         :return: A dictionary with timestamps for the given camera and license plate.
         """
 
-        require_non_empty_str(camera_id, "camera_id")
-        require_non_empty_str(license_plate, "license_plate")
+        if not isinstance(camera_id, str) or not camera_id.strip():
+            raise ValueError("camera_id must be a non-empty string")
+        if not isinstance(license_plate, str) or not license_plate.strip():
+            raise ValueError("license_plate must be a non-empty string")
 
         params = {
             "camera_id": camera_id,
@@ -306,7 +371,7 @@ class CamerasClient(BaseClient):
             "page_size": page_size,
             "page_token": page_token
         }
-        params = remove_null_fields(params)
+        params = remove_null_fields_inplace(params)
         url = f"{LPR_TIMESTAMPS_ENDPOINT}"
         return self.request_manager.get(url, params=params)
 
@@ -315,8 +380,9 @@ class CamerasClient(BaseClient):
                                camera_id: str,
                                license_plate: str,
                                start_time: Optional[int] = None,
-                               end_time: Optional[int] = None) \
-            -> Generator[Any, None, None]:
+                               end_time: Optional[int] = None,
+                               limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
 
         :param camera_id:
@@ -329,8 +395,10 @@ class CamerasClient(BaseClient):
         :type end_time: int or None
         :param end_time:
         :type end_time:
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of detection dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_lpr_timestamps(**kwargs),
@@ -341,13 +409,16 @@ class CamerasClient(BaseClient):
                     "end_time": end_time if end_time else None
                 },
                 next_token_key="next_page_token",
-                items_key="detections"
+                items_key="detections",
+                limit=limit
             )
 
     @typechecked
     def get_all_object_counts(self, camera_id: str,
                               start_time: Optional[int] = None,
-                              end_time: Optional[int] = None):
+                              end_time: Optional[int] = None,
+                              limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
 
         :param camera_id:
@@ -358,8 +429,10 @@ class CamerasClient(BaseClient):
         :type end_time: int or None
         :param end_time:
         :type end_time:
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of object count dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_object_counts(**kwargs),
@@ -369,7 +442,8 @@ class CamerasClient(BaseClient):
                 "camera_id":camera_id,
                 "start_time": start_time,
                 "end_time": end_time
-            }
+            },
+            limit=limit
         )
     
     @typechecked
@@ -393,7 +467,8 @@ class CamerasClient(BaseClient):
         :return:
         :rtype:
         """
-        require_non_empty_str(camera_id, "camera_id")
+        if not isinstance(camera_id, str) or not camera_id.strip():
+            raise ValueError("camera_id must be a non-empty string")
         params = {
             "camera_id": camera_id,
             "start_time": start_time,
@@ -401,7 +476,7 @@ class CamerasClient(BaseClient):
             "page_size": page_size,
             "page_token": page_token
         }
-        params = remove_null_fields(params)
+        params = remove_null_fields_inplace(params)
         return self.request_manager.get(OBJECT_COUNT_ENDPOINT, params=params)
     
     @typechecked
@@ -453,12 +528,12 @@ class CamerasClient(BaseClient):
         :param type: Data type; for example, "person".
         :return: A JSON object with occupancy trends data.
         """
-        if type not in VALID_OCCUPANCY_TRENDS_TYPES_ENUM.values():
+        if type not in VALID_OCCUPANCY_TRENDS_TYPES_VALUES:
             raise ValueError(f"Occupancy Trend Type {type} is not in the "
                              f"list of valid event types: "
                              f"{list(VALID_OCCUPANCY_TRENDS_TYPES_ENUM.values())}")
     
-        if interval not in VALID_OCCUPANCY_TRENDS_INTERVALS_ENUM.values():
+        if interval not in VALID_OCCUPANCY_TRENDS_INTERVALS_VALUES:
             raise ValueError(
                 f"Occupancy Trend Interval {interval} is not in the "
                 f"list of valid event types: "
@@ -480,13 +555,16 @@ class CamerasClient(BaseClient):
     def get_cloud_backup_settings(self, camera_id: str) -> dict:
         """
         Retrieves cloud backup settings for a specified camera.
+
+        Repeated calls send the last ETag seen for the camera, so unchanged
+        settings come back as a 304 and are served from the client's cache.
     
         :param camera_id: The unique identifier of the camera.
         :return: A dictionary of the current cloud backup settings.
         """
         params = {"camera_id": camera_id}
         url = f"{CLOUD_BACKUP_ENDPOINT}"
-        return self.request_manager.get(url, params=params)
+        return self.request_manager.get(url, params=params, conditional=True)
     
     @typechecked
     def update_cloud_backup_settings(self, camera_id: str,
@@ -548,11 +626,11 @@ class CamerasClient(BaseClient):
             raise ValueError(
                 "start_time and end_time in upload_timeslot must be integers between 0 and 86400.")
     
-        if video_quality not in VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM.values():
+        if video_quality not in VALID_CLOUD_BACKUP_VIDEO_QUALITY_VALUES:
             raise ValueError(
                 f"video_quality must be one of {VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM}.")
     
-        if video_to_upload not in VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM.values():
+        if video_to_upload not in VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_VALUES:
             raise ValueError(
                 f"video_to_upload must be one of {VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM.values()}.")
     
@@ -572,16 +650,21 @@ class CamerasClient(BaseClient):
         url = f"{CLOUD_BACKUP_ENDPOINT}"
         return self.request_manager.post(url, payload)
     
-    def get_all_camera_data(self):
+    def get_all_camera_data(self, limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
+        Lazily iterates through camera details across all pages.
 
-        :return:
-        :rtype:
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of camera dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_camera_data(**kwargs),
             items_key="cameras_tests",
-            next_token_key="next_page_token"
+            next_token_key="next_page_token",
+            limit=limit
         )
     
     @typechecked
@@ -589,6 +672,10 @@ class CamerasClient(BaseClient):
                         page_token: Optional[str] = None) -> dict:
         """
         Returns details of all cameras_tests within the organization.
+
+        Repeated calls for the same page send the last ETag seen, so an
+        unchanged page comes back as a 304 and is served from the client's
+        cache.
     
         :param page_size: The number of items per response.
         :param page_token: Pagination token for the next page.
@@ -598,9 +685,9 @@ class CamerasClient(BaseClient):
             "page_size": page_size,
             "page_token": page_token
         }
-        params = remove_null_fields(params)
+        params = remove_null_fields_inplace(params)
         url = f"{CAMERA_DATA_ENDPOINT}"
-        return self.request_manager.get(url, params=params)
+        return self.request_manager.get(url, params=params, conditional=True)
 
     @typechecked
     def get_footage_link(self, camera_id: str,
@@ -651,14 +738,21 @@ class CamerasClient(BaseClient):
         url = f"{THUMBNAIL_LINK_ENDPOINT}"
         return self.request_manager.get(url, params=params)
     
-    def get_all_pois(self):
+    def get_all_pois(self, limit: Optional[int] = None) \
+            -> Generator[dict, None, None]:
         """
         Iterates through paginated results for Persons of Interest.
+
+        :param limit: Optional maximum number of items to yield. Pagination
+            stops as soon as it is reached.
+        :type limit: int or None
+        :return: A generator of person of interest dictionaries.
         """
         return VerkadaRequestManager.iterate_paginated_results(
             lambda **kwargs: self.get_pois(**kwargs),
             items_key="persons_of_interest",
-            next_token_key="page_token"
+            next_token_key="page_token",
+            limit=limit
         )
     
     @typechecked
@@ -748,7 +842,7 @@ class CamerasClient(BaseClient):
             "camera_id": camera_id,
             "start_time": start_time,
             "end_time": end_time,
-            "search_zones": str(search_zones)
+            "search_zones": json.dumps(search_zones) if search_zones else None
         }
         params = remove_null_fields(params)
         return self.request_manager.get(MAX_OBJECT_COUNT_ENDPOINT, params=params)
@@ -813,6 +907,22 @@ def create_lpoi(license_plate: str, description: str):
     """
     return CamerasClient().create_lpoi(license_plate, description)
 
+@typechecked
+def create_lpois_batch(entries: List[Tuple[str, str]], max_workers: int = 8):
+    """
+    Creates many License Plates of Interest, issuing the requests
+    concurrently instead of one after another.
+
+    :param entries: A list of (license_plate, description) pairs.
+    :param max_workers: The maximum number of requests in flight at once.
+    :return: The created LPOI objects, in the same order as entries.
+
+    ---
+
+    **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
+    """
+    return CamerasClient().create_lpois_batch(entries, max_workers)
+
 @typechecked
 def create_poi(image_url: str, label: str):
     """
@@ -852,6 +962,22 @@ def delete_lpoi(license_plate: str):
     """
     return CamerasClient().delete_lpoi(license_plate)
 
+@typechecked
+def delete_lpois_batch(license_plates: List[str], max_workers: int = 8):
+    """
+    Deletes many License Plates of Interest, issuing the requests
+    concurrently instead of one after another.
+
+    :param license_plates: The license plates to delete.
+    :param max_workers: The maximum number of requests in flight at once.
+    :return: The deleted LPOI objects, in the same order as license_plates.
+
+    ---
+
+    **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
+    """
+    return CamerasClient().delete_lpois_batch(license_plates, max_workers)
+
 @typechecked
 def delete_poi(person_id: str):
     """
@@ -864,7 +990,7 @@ def delete_poi(person_id: str):
     return CamerasClient().delete_poi(person_id)
 
 @typechecked
-def get_all_camera_alerts(start_time: Optional[int] = None, end_time: Optional[int] = None, include_image_url: Optional[bool] = None, notification_type: Optional[List[str]] = None):
+def get_all_camera_alerts(start_time: Optional[int] = None, end_time: Optional[int] = None, include_image_url: Optional[bool] = None, notification_type: Optional[List[str]] = None, limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -872,10 +998,10 @@ def get_all_camera_alerts(start_time: Optional[int] = None, end_time: Optional[i
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_camera_alerts(start_time, end_time, include_image_url, notification_type)
+    return CamerasClient().get_all_camera_alerts(start_time, end_time, include_image_url, notification_type, limit)
 
 @typechecked
-def get_all_camera_data():
+def get_all_camera_data(limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -883,10 +1009,10 @@ def get_all_camera_data():
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_camera_data()
+    return CamerasClient().get_all_camera_data(limit)
 
 @typechecked
-def get_all_lpois():
+def get_all_lpois(limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -894,10 +1020,10 @@ def get_all_lpois():
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_lpois()
+    return CamerasClient().get_all_lpois(limit)
 
 @typechecked
-def get_all_lpr_timestamps(camera_id: str, license_plate: str, start_time: Optional[int] = None, end_time: Optional[int] = None):
+def get_all_lpr_timestamps(camera_id: str, license_plate: str, start_time: Optional[int] = None, end_time: Optional[int] = None, limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -905,10 +1031,10 @@ def get_all_lpr_timestamps(camera_id: str, license_plate: str, start_time: Optio
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_lpr_timestamps(camera_id, license_plate, start_time, end_time)
+    return CamerasClient().get_all_lpr_timestamps(camera_id, license_plate, start_time, end_time, limit)
 
 @typechecked
-def get_all_object_counts(camera_id: str, start_time: Optional[int] = None, end_time: Optional[int] = None):
+def get_all_object_counts(camera_id: str, start_time: Optional[int] = None, end_time: Optional[int] = None, limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -916,10 +1042,10 @@ def get_all_object_counts(camera_id: str, start_time: Optional[int] = None, end_
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_object_counts(camera_id, start_time, end_time)
+    return CamerasClient().get_all_object_counts(camera_id, start_time, end_time, limit)
 
 @typechecked
-def get_all_pois():
+def get_all_pois(limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     Iterates through paginated results for Persons of Interest.
 
@@ -927,10 +1053,10 @@ def get_all_pois():
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_pois()
+    return CamerasClient().get_all_pois(limit)
 
 @typechecked
-def get_all_seen_license_plates(camera_id: str, license_plate: Optional[str] = None, start_time: Optional[int] = None, end_time: Optional[int] = None):
+def get_all_seen_license_plates(camera_id: str, license_plate: Optional[str] = None, start_time: Optional[int] = None, end_time: Optional[int] = None, limit: Optional[int] = None) -> Generator[dict, None, None]:
     """
     No docstring found.
 
@@ -938,7 +1064,7 @@ def get_all_seen_license_plates(camera_id: str, license_plate: Optional[str] = N
 
     **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
     """
-    return CamerasClient().get_all_seen_license_plates(camera_id, license_plate, start_time, end_time)
+    return CamerasClient().get_all_seen_license_plates(camera_id, license_plate, start_time, end_time, limit)
 
 @typechecked
 def get_camera_alerts(start_time: Optional[int] = None, end_time: Optional[int] = None, include_image_url: Optional[bool] = None, notification_type: Optional[List[str]] = None, page_token: Optional[str] = None, page_size: Optional[int] = None):
@@ -1215,6 +1341,22 @@ def update_lpoi(license_plate: str, description: str):
     """
     return CamerasClient().update_lpoi(license_plate, description)
 
+@typechecked
+def update_lpois_batch(entries: List[Tuple[str, str]], max_workers: int = 8):
+    """
+    Updates the descriptions of many License Plates of Interest, issuing
+    the requests concurrently instead of one after another.
+
+    :param entries: A list of (license_plate, description) pairs.
+    :param max_workers: The maximum number of requests in flight at once.
+    :return: The updated LPOI objects, in the same order as entries.
+
+    ---
+
+    **Note:** This is a functional wrapper for its equivalent method in the CamerasClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a CamerasClient object directly for better performance.
+    """
+    return CamerasClient().update_lpois_batch(entries, max_workers)
+
 @typechecked
 def update_poi(person_id: str, label: str):
     """
@@ -1,9 +1,26 @@
 import pytest
 from typeguard import TypeCheckError
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Import your actual module here. Adjust `alerts` if needed.
-from pykada.access_control.cameras import *
+from pykada.cameras import *
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_request_manager():
+    """
+    Patches the default request manager once for the whole module, so the
+    functional wrappers never hit the network. Each HTTP verb returns a
+    canned dict.
+    """
+    manager = MagicMock(spec=VerkadaRequestManager)
+    manager.get.return_value = {"status": "ok"}
+    manager.post.return_value = {"created": True}
+    manager.patch.return_value = {"updated": True}
+    manager.delete.return_value = {"deleted": True}
+    with patch("pykada.verkada_client.get_default_request_manager",
+               return_value=manager):
+        yield manager
 
 # ---------- Type Error Tests ----------
 
@@ -33,37 +50,33 @@ def test_type_errors(func, kwargs):
 
 # ---------- Dict Return Type Tests (Mocked) ----------
 
-@patch("cameras_tests.get_request", return_value={"status": "ok"})
 @pytest.mark.parametrize("func, kwargs", [
     (get_camera_alerts, {}),
     (get_lpois, {}),
     (get_lpr_timestamps, {"camera_id": "cam1", "license_plate": "XYZ"}),
     (get_object_counts, {"camera_id": "cam1"}),
-    (get_occupancy_trends, {"camera_id": "cam1"}),
+    (get_occupancy_trends, {"camera_id": "cam1", "type": "person",
+                            "interval": "1_hour"}),
     (get_cloud_backup_settings, {"camera_id": "cam1"}),
     (get_camera_data, {}),
 ])
-def test_get_request_dict_returns(mock_get, func, kwargs):
+def test_get_request_dict_returns(func, kwargs):
     result = func(**kwargs)
     assert isinstance(result, dict)
 
-@patch("cameras_tests.delete_request", return_value={"deleted": True})
-def test_delete_lpoi_returns_dict(mock_delete):
+def test_delete_lpoi_returns_dict():
     result = delete_lpoi("ABC123")
     assert isinstance(result, dict)
 
-@patch("cameras_tests.patch_request", return_value={"updated": True})
-def test_update_lpoi_returns_dict(mock_patch):
+def test_update_lpoi_returns_dict():
     result = update_lpoi("ABC123", "Updated description")
     assert isinstance(result, dict)
 
-@patch("cameras_tests.post_request", return_value={"created": True})
-def test_create_lpoi_returns_dict(mock_post):
+def test_create_lpoi_returns_dict():
     result = create_lpoi("XYZ999", "Stolen Vehicle")
     assert isinstance(result, dict)
 
-@patch("cameras_tests.post_request", return_value={"configured": True})
-def test_set_object_position_mqtt_returns_dict(mock_post):
+def test_set_object_position_mqtt_returns_dict():
     result = set_object_position_mqtt(
         broker_cert="cert",
         broker_host_port="broker:1883",
@@ -73,23 +86,21 @@ def test_set_object_position_mqtt_returns_dict(mock_post):
     )
     assert isinstance(result, dict)
 
-@patch("cameras_tests.post_request", return_value={"backup": True})
-def test_set_cloud_backup_settings_returns_dict(mock_post):
+def test_set_cloud_backup_settings_returns_dict():
     result = update_cloud_backup_settings(
         camera_id="cam1",
         days_to_preserve="1,1,1,1,1,1,1",
         enabled=True,
         time_to_preserve="0,86400",
-        upload_timeslot="night",
+        upload_timeslot="0,21600",
         video_quality="STANDARD_QUALITY",
         video_to_upload="ALL"
     )
     assert isinstance(result, dict)
 
 
-@patch("viewing_stations.get_request")
-def test_get_viewing_stations_returns_dict(mock_get):
-    mock_get.return_value = {"viewing_stations": []}
+def test_get_viewing_stations_returns_dict(mock_request_manager):
+    mock_request_manager.get.reset_mock()
     result = get_viewing_stations()
     assert isinstance(result, dict)
-    mock_get.assert_called_once()
+    mock_request_manager.get.assert_called_once()
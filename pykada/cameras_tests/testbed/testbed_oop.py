@@ -1,15 +1,21 @@
+import csv
 import os
 import random
 import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
+from dotenv import load_dotenv
 from termcolor import cprint
 
-from pykada.cameras.camera_stream import get_stream_playlist_url
-from pykada.access_control.cameras import *
+from pykada.cameras import CamerasClient
 
-import pandas as pd
-
-import vlc
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
 
 from pykada.enums import VALID_OCCUPANCY_TRENDS_INTERVALS_ENUM, \
     VALID_OCCUPANCY_TRENDS_TYPES_ENUM, VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM, \
@@ -29,6 +35,13 @@ one_hour_ago = current_time - 3600
 
 cameras_client = CamerasClient(api_key=api_key)
 
+# Pool of characters (uppercase letters and digits) for random plates
+_ALPHANUM = string.ascii_uppercase + string.digits
+
+# Valid cloud backup enum values, converted to lists once for random.choice
+_VIDEO_QUALITIES = list(VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM.values())
+_VIDEO_UPLOADS = list(VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM.values())
+
 def generate_random_alphanumeric_string(length: int) -> str:
   """
   Generates a random string of uppercase alphanumeric characters.
@@ -40,18 +53,14 @@ def generate_random_alphanumeric_string(length: int) -> str:
     A random string of the specified length containing uppercase letters (A-Z)
     and digits (0-9).
   """
-  # Define the pool of characters (uppercase letters and digits)
-  characters = string.ascii_uppercase + string.digits
-
-  # Use random.choice to pick characters and join them into a string
-  random_string = ''.join(random.choice(characters) for i in range(length))
-
-  return random_string
+  # Draw all characters in one call rather than one random.choice per character
+  return ''.join(random.choices(_ALPHANUM, k=length))
 
 def extract_license_plates_pandas(input_csv_path: str, output_csv_path: str) -> bool:
     """
-    Reads a CSV file using pandas, extracts the 'License Plate' column,
-    and saves it to a new CSV file.
+    Reads a CSV file, extracts the 'License Plate' column, and saves it to a
+    new CSV file. Uses PyArrow's CSV reader/writer when pyarrow is installed,
+    which avoids building a DataFrame; otherwise falls back to pandas.
 
     Note: This function expects the input CSV to have a column named
     'License Plate'. It will raise an error if this column is missing.
@@ -72,10 +81,30 @@ def extract_license_plates_pandas(input_csv_path: str, output_csv_path: str) ->
         return False
 
     try:
+        if pa_csv is not None:
+            # Read only the needed column straight into an Arrow table and
+            # write it back out without materializing a DataFrame. A missing
+            # column raises ArrowInvalid, which is a ValueError.
+            table = pa_csv.read_csv(
+                input_csv_path,
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[column_to_extract],
+                    column_types={column_to_extract: pa.string()}))
+            pa_csv.write_csv(table, output_csv_path)
+
+            print(f"Successfully extracted '{column_to_extract}' column from '{input_csv_path}' to '{output_csv_path}' using pyarrow.")
+            return True
+
+        # pandas is only needed when pyarrow is unavailable
+        import pandas as pd
+
         # Read the input CSV file into a pandas DataFrame
         # Use usecols to read only the necessary column to improve performance for large files
         # Error will be raised if 'License Plate' column is not found
-        df = pd.read_csv(input_csv_path, usecols=[column_to_extract])
+        # Plates are always strings; declaring the dtype skips inference and
+        # keeps all-digit plates (and leading zeros) intact
+        df = pd.read_csv(input_csv_path, usecols=[column_to_extract],
+                         dtype={column_to_extract: "string"})
 
         # Ensure the column exists after reading (usecols should handle this, but as a safeguard)
         if column_to_extract not in df.columns:
@@ -107,29 +136,55 @@ def extract_license_plates_pandas(input_csv_path: str, output_csv_path: str) ->
         return False
 
 def poi_test():
+    # The create and update steps are checked against the entity the API
+    # returns; only the delete step lists POIs to confirm server state.
     create_poi_resp = cameras_client.create_poi(image_url='Cary-Grant.png',
                                  label='Cary Grant Test')
 
-    get_poi_response = cameras_client.get_all_pois()
-
-    if create_poi_resp not in [p for p in get_poi_response]:
+    if not create_poi_resp.get("person_id"):
         cprint("Create POI Unsuccessful", "red")
+        return
     poi_id = create_poi_resp['person_id']
     try:
         update_poi_response = cameras_client.update_poi(person_id=poi_id, label="Roger Thornhill")
-        get_poi_response = cameras_client.get_all_pois()
 
-        if update_poi_response not in [p for p in get_poi_response]:
+        if update_poi_response.get("label") != "Roger Thornhill":
             cprint("Update POI Unsuccessful", "red")
             return
     finally:
         delete_poi_response = cameras_client.delete_poi(person_id=poi_id)
-        get_poi_response = cameras_client.get_all_pois()
-        if delete_poi_response in [p for p in get_poi_response]:
+        # get_all_pois() is lazy, so any() stops paging at the first match
+        if any(p["person_id"] == poi_id for p in cameras_client.get_all_pois()):
             cprint("Delete POI Unsuccessful", "red")
             return
         cprint("POI CRUD Test Successful", "green")
 
+def read_license_plates(csv_path: str) -> set:
+    """
+    Returns the set of values in the 'License Plate' column of a CSV file.
+    """
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        return {row["License Plate"] for row in csv.DictReader(csvfile)}
+
+def wait_for_lpois(expected_plates: set, timeout: float = 5.0) -> bool:
+    """
+    Polls the LPOI list with exponential backoff (starting at 100ms) until
+    every plate in expected_plates is present or the timeout expires.
+
+    Returns:
+        True if all plates appeared before the timeout, False otherwise.
+    """
+    delay = 0.1
+    deadline = time.monotonic() + timeout
+    while True:
+        seen = {p["license_plate"] for p in cameras_client.get_all_lpois()}
+        if expected_plates <= seen:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay *= 2
+
 def bulk_lpoi_test():
     create_lpois_response  = cameras_client.create_bulk_lpois(create_license_plate_csv_path)
     print(create_lpois_response)
@@ -137,7 +192,7 @@ def bulk_lpoi_test():
     if isinstance(create_lpois_response, dict):
         extract_license_plates_pandas(create_license_plate_csv_path, delete_license_plate_csv_path)
 
-        time.sleep(3)
+        wait_for_lpois(read_license_plates(create_license_plate_csv_path))
         delete_lpois_response = cameras_client.delete_bulk_lpois(delete_license_plate_csv_path)
         print(delete_lpois_response)
 
@@ -145,15 +200,12 @@ def bulk_lpoi_test():
 
 def lpoi_test():
     success = True
+    # Same approach as poi_test: only the delete step lists LPOIs.
     create_lpoi_resp = cameras_client.create_lpoi(license_plate=generate_random_alphanumeric_string(6),
                                   description="Test Plate Please Delete")
     print(create_lpoi_resp)
 
-    get_lpoi_response = cameras_client.get_all_lpois()
-
-    # print([p for p in get_lpoi_response])
-
-    if create_lpoi_resp not in [p for p in get_lpoi_response]:
+    if not create_lpoi_resp.get("license_plate"):
         cprint("Create LPOI Unsuccessful", "red")
         return
 
@@ -161,15 +213,14 @@ def lpoi_test():
     try:
         update_lpoi_response = cameras_client.update_lpoi(license_plate=license_plate,
                                          description="Update LPOI Test Please Delete")
-        get_lpoi_response = cameras_client.get_all_lpois()
 
-        if update_lpoi_response not in [p for p in get_lpoi_response]:
+        if update_lpoi_response.get("description") != "Update LPOI Test Please Delete":
             cprint("Update LPOI Unsuccessful", "red")
             return
     finally:
         delete_poi_response = cameras_client.delete_lpoi(license_plate=license_plate)
-        get_lpoi_response = cameras_client.get_all_lpois()
-        if delete_poi_response in [p for p in get_lpoi_response]:
+        if any(p["license_plate"] == license_plate
+               for p in cameras_client.get_all_lpois()):
             cprint("Delete LPOI Unsuccessful", "red")
             return
         cprint("LPOI CRUD Test Successful", "green")
@@ -235,17 +286,8 @@ def occupancy_trends_test():
     cprint("Get Occupancy Trends Dashboard Data Test Successful", "green")
 
 def object_count_test():
-    # Create an empty list to store the pairs
-    all_search_zones = []
-
-    # Iterate through all possible values for the first coordinate (0-9)
-    for x in range(10):
-        # Iterate through all possible values for the second coordinate (0-9)
-        for y in range(10):
-            # Create the coordinate pair [x, y]
-            coordinate_pair = [x, y]
-            # Add the coordinate pair to the list
-            all_search_zones.append(coordinate_pair)
+    # Every [x, y] coordinate pair on a 10x10 grid
+    all_search_zones = [[x, y] for x in range(10) for y in range(10)]
 
     max_people_vehicle_counts_data = cameras_client.get_max_people_vehicle_counts(
         camera_id=lpr_camera_id,
@@ -274,23 +316,42 @@ def camera_audio_test(enable_audio: Optional[bool] = False):
         camera_audio_status = cameras_client.get_camera_audio_status(camera_id=camera_id)
         print(camera_audio_status)
 
-def cloud_backup_test():
-    import random
+def _random_time_slot_ints():
+    # Seconds since midnight, with end_time never before start_time
+    start_time = random.randint(0, 86399)
+    end_time = random.randint(start_time, 86399)
+    return start_time, end_time
 
-    def generate_random_time_slot():
-        start_time = random.randint(0, 86399)
-        end_time = random.randint(start_time, 86399)
-        return f"{start_time},{end_time}"
+def generate_random_time_slot():
+    start_time, end_time = _random_time_slot_ints()
+    return f"{start_time},{end_time}"
 
-    def generate_random_days_to_preserve():
-        return ",".join(str(random.randint(0, 1)) for _ in range(7))
+def generate_random_days_to_preserve():
+    return ",".join(map(str, random.choices((0, 1), k=7)))
 
-    def generate_random_video_quality():
-        return random.choice(list(VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM.values()))
+def generate_random_video_quality():
+    return random.choice(_VIDEO_QUALITIES)
 
-    def generate_random_video_to_upload():
-        return random.choice(list(VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM.values()))
+def generate_random_video_to_upload():
+    return random.choice(_VIDEO_UPLOADS)
 
+_CLOUD_BACKUP_SETTINGS_KEYS = {
+    "camera_id", "days_to_preserve", "enabled", "time_to_preserve",
+    "upload_timeslot", "video_quality", "video_to_upload",
+}
+
+def applied_cloud_backup_settings(update_response) -> dict:
+    """
+    Returns the applied cloud backup settings for a camera. If the update
+    response already echoes the full configuration it is used as-is;
+    otherwise the settings are fetched again.
+    """
+    if isinstance(update_response, dict) and \
+            _CLOUD_BACKUP_SETTINGS_KEYS <= update_response.keys():
+        return update_response
+    return cameras_client.get_cloud_backup_settings(camera_id=camera_id)
+
+def cloud_backup_test():
     # Get the current cloud backup settings
     current_settings = cameras_client.get_cloud_backup_settings(camera_id=camera_id)
     print("Current Settings:", current_settings)
@@ -312,7 +373,7 @@ def cloud_backup_test():
         print("Updated Settings Response:", update_settings_response)
 
         # Verify the updated settings
-        updated_settings = cameras_client.get_cloud_backup_settings(camera_id=camera_id)
+        updated_settings = applied_cloud_backup_settings(update_settings_response)
         print("Updated Settings:", updated_settings)
 
     finally:
@@ -324,7 +385,7 @@ def cloud_backup_test():
         print("Restored Original Settings Response:", restore_response)
 
         # Verify the restored settings
-        restored_settings = cameras_client.get_cloud_backup_settings(camera_id=camera_id)
+        restored_settings = applied_cloud_backup_settings(restore_response)
         print("Restored Settings:", restored_settings)
 
     cprint("Cloud Backup Test Successful", "green")
@@ -368,6 +429,9 @@ def camera_footage_test():
 
     # Verify the M3U8 playlist using VLC
     try:
+        # Loading libvlc is expensive, so only do it for this test
+        import vlc
+
         instance = vlc.Instance()
         player = instance.media_player_new()
         media = instance.media_new(streaming_playlist)
@@ -388,14 +452,27 @@ def camera_footage_test():
 
 
 
-poi_test()
-bulk_lpoi_test()
-lpoi_test()
-get_license_plates_test()
-get_camera_alerts_test()
-occupancy_trends_test()
-camera_audio_test(enable_audio=False)
-cloud_backup_test()
-object_count_test()
-camera_footage_test()
-print("Camera Testbed Test Successful")
\ No newline at end of file
+def camera_settings_tests():
+    # Both tests read and write settings on the same camera_id, so they must
+    # not overlap with each other.
+    camera_audio_test(enable_audio=False)
+    cloud_backup_test()
+
+if __name__ == "__main__":
+    # The subtests are independent and spend nearly all their time waiting on
+    # the API, so run them concurrently.
+    tests = [
+        poi_test,
+        bulk_lpoi_test,
+        lpoi_test,
+        get_license_plates_test,
+        get_camera_alerts_test,
+        occupancy_trends_test,
+        camera_settings_tests,
+        object_count_test,
+        camera_footage_test,
+    ]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        # list() surfaces any exception raised by a subtest
+        list(executor.map(lambda test: test(), tests))
+    print("Camera Testbed Test Successful")
\ No newline at end of file
@@ -1,9 +1,25 @@
-from typeguard import typechecked
-from typing import Dict, Any, List
+from functools import lru_cache
 
+from pykada._typecheck import typechecked
+from typing import Dict, Any, List, Optional
+
+from pykada.api_tokens import VerkadaTokenManager
 from pykada.endpoints import ALARMS_DEVICES_ENDPOINT, ALARMS_SITES_ENDPOINT
 from pykada.verkada_client import BaseClient
-from pykada.verkada_requests import *
+
+# Largest id list sent in a single request. Longer lists are split across
+# several requests so no single query string (or joined id string) grows
+# without bound.
+MAX_IDS_PER_REQUEST = 1000
+
+@lru_cache(maxsize=128)
+def _join_ids(ids: tuple) -> str:
+    """
+    Joins a tuple of ids into the comma-separated form the API expects.
+    Cached so polling loops that pass the same ids every cycle don't
+    rebuild the string each time.
+    """
+    return ",".join(ids)
 
 class ClassicAlarmsClient(BaseClient):
     """
@@ -35,7 +51,8 @@ class ClassicAlarmsClient(BaseClient):
 
         params: Dict[str, Any] = {"site_id": site_id}
         if device_ids:
-            params["device_ids"] = ",".join(device_ids)
+            return self._get_in_id_chunks(ALARMS_DEVICES_ENDPOINT, params,
+                                          "device_ids", device_ids)
 
         return self.request_manager.get(ALARMS_DEVICES_ENDPOINT, params=params)
 
@@ -54,10 +71,58 @@ class ClassicAlarmsClient(BaseClient):
         """
         params: Dict[str, Any] = {}
         if site_ids:
-            params["site_ids"] = ",".join(site_ids)
+            return self._get_in_id_chunks(ALARMS_SITES_ENDPOINT, params,
+                                          "site_ids", site_ids)
 
         return self.request_manager.get(ALARMS_SITES_ENDPOINT, params=params)
 
+    def _get_in_id_chunks(self, url: str, params: Dict[str, Any],
+                          ids_key: str, ids: List[str]) -> Dict[str, Any]:
+        """
+        GET url with ids sent as a comma-separated ids_key parameter. Lists
+        longer than MAX_IDS_PER_REQUEST are split into several requests and
+        the list values of the responses are concatenated. Any other value
+        must be the same in every response.
+
+        :raises ValueError: If the responses to two chunks have different
+            values for the same non-list key.
+        """
+        if len(ids) <= MAX_IDS_PER_REQUEST:
+            return self.request_manager.get(
+                url, params={**params, ids_key: _join_ids(tuple(ids))})
+
+        merged: Dict[str, Any] = {}
+        for start in range(0, len(ids), MAX_IDS_PER_REQUEST):
+            chunk = ids[start:start + MAX_IDS_PER_REQUEST]
+            response = self.request_manager.get(
+                url, params={**params, ids_key: ",".join(chunk)})
+            for key, value in response.items():
+                if key not in merged:
+                    # Copy lists so extending them never modifies a response
+                    # the request manager may have cached
+                    merged[key] = list(value) if isinstance(value, list) else value
+                elif isinstance(value, list) and isinstance(merged[key], list):
+                    merged[key].extend(value)
+                elif merged[key] != value:
+                    raise ValueError(
+                        f"Responses for different {ids_key} chunks have "
+                        f"different values for '{key}', which can't be "
+                        f"merged")
+        return merged
+
+
+@lru_cache(maxsize=1)
+def _default_client() -> ClassicAlarmsClient:
+    """
+    Returns the ClassicAlarmsClient used by get_alarm_devices and
+    get_alarm_site_information, building it on the first call. Threads that
+    make that first call at the same moment may each build a client, but
+    every client sends requests through the same default request manager.
+    Call _default_client.cache_clear() after changing VERKADA_API_KEY so the
+    next call builds a new client.
+    """
+    return ClassicAlarmsClient()
+
 @typechecked
 def get_alarm_devices(site_id: str, device_ids: Optional[List[str]] = None):
     """
@@ -73,9 +138,9 @@ def get_alarm_devices(site_id: str, device_ids: Optional[List[str]] = None):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the ClassicAlarmsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use an ClassicAlarmsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the ClassicAlarmsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a ClassicAlarmsClient object directly.
     """
-    return ClassicAlarmsClient().get_alarm_devices(site_id, device_ids)
+    return _default_client().get_alarm_devices(site_id, device_ids)
 
 @typechecked
 def get_alarm_site_information(site_ids: Optional[List[str]] = None):
@@ -90,6 +155,6 @@ def get_alarm_site_information(site_ids: Optional[List[str]] = None):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the ClassicAlarmsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use an ClassicAlarmsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the ClassicAlarmsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a ClassicAlarmsClient object directly.
     """
-    return ClassicAlarmsClient().get_alarm_site_information(site_ids)
\ No newline at end of file
+    return _default_client().get_alarm_site_information(site_ids)
\ No newline at end of file
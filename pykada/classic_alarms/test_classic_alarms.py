@@ -1,10 +1,13 @@
 import pytest
-from typeguard import TypeCheckError
-from unittest.mock import patch
+from pykada._typecheck import TypeCheckError
+from unittest.mock import MagicMock, patch
 
 # Adjust this import to point at the module where you defined these two functions.
-from pykada.classic_alarms import get_alarm_devices, get_alarm_site_information
+from pykada.api_tokens import VerkadaTokenManager
+from pykada.classic_alarms import get_alarm_devices, \
+    get_alarm_site_information, ClassicAlarmsClient, MAX_IDS_PER_REQUEST
 from pykada.endpoints import ALARMS_DEVICES_ENDPOINT, ALARMS_SITES_ENDPOINT
+from pykada.verkada_requests import VerkadaRequestManager
 
 
 # ————— get_alarm_devices ————— #
@@ -63,3 +66,50 @@ def test_get_site_information_with_site_ids(mock_get):
         params={"site_ids": "s1,s2,s3"}
     )
     assert result == {"sites": ["s1","s2"]}
+
+
+# ————— requests split into id chunks ————— #
+
+@pytest.fixture
+def chunk_client():
+    client = ClassicAlarmsClient(
+        token_manager=VerkadaTokenManager(api_key="test-key"))
+    client.request_manager = MagicMock(spec=VerkadaRequestManager)
+    return client
+
+
+def test_site_ids_over_chunk_size_merges_lists_without_mutating_responses(
+        chunk_client):
+    first = {"sites": ["s1"], "org_id": "org"}
+    second = {"sites": ["s2"], "org_id": "org"}
+    chunk_client.request_manager.get.side_effect = [first, second]
+    site_ids = [f"s{i}" for i in range(MAX_IDS_PER_REQUEST + 1)]
+
+    result = chunk_client.get_alarm_site_information(site_ids=site_ids)
+
+    assert result == {"sites": ["s1", "s2"], "org_id": "org"}
+    assert first == {"sites": ["s1"], "org_id": "org"}
+    assert chunk_client.request_manager.get.call_count == 2
+
+
+def test_site_ids_over_chunk_size_conflicting_values_raise(chunk_client):
+    chunk_client.request_manager.get.side_effect = [
+        {"sites": [], "next_page_token": "a"},
+        {"sites": [], "next_page_token": "b"}]
+    site_ids = [f"s{i}" for i in range(MAX_IDS_PER_REQUEST + 1)]
+
+    with pytest.raises(ValueError, match="next_page_token"):
+        chunk_client.get_alarm_site_information(site_ids=site_ids)
+
+
+def test_device_ids_do_not_modify_caller_params(chunk_client):
+    chunk_client.request_manager.get.return_value = {"devices": []}
+    params = {"site_id": "site123"}
+
+    chunk_client._get_in_id_chunks(ALARMS_DEVICES_ENDPOINT, params,
+                                   "device_ids", ["dev1"])
+
+    assert params == {"site_id": "site123"}
+    chunk_client.request_manager.get.assert_called_once_with(
+        ALARMS_DEVICES_ENDPOINT,
+        params={"site_id": "site123", "device_ids": "dev1"})
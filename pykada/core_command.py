@@ -1,10 +1,49 @@
-from typeguard import typechecked
-from typing import Dict, Any
+import copy
+import time
 
+from pykada._backpressure import with_backpressure
+from pykada._typecheck import typechecked
+from typing import Dict, Any, Callable, Generator, AsyncGenerator, List, \
+    Optional, Tuple, Union
+
+from pykada.api_tokens import VerkadaTokenManager
 from pykada.endpoints import AUDIT_LOG_ENDPOINT, COMMAND_USER_ENDPOINT
-from pykada.helpers import check_user_external_id, remove_null_fields
+from pykada.helpers import check_user_external_id, non_null_fields, \
+    run_concurrently, TTLCache
 from pykada.verkada_client import BaseClient
-from pykada.verkada_requests import *
+from pykada.verkada_requests import VerkadaRequestManager
+
+
+def _resolve_audit_log_window(start_time: Optional[int],
+                              end_time: Optional[int]) -> Tuple[int, int]:
+    """
+    Fill in the default audit log time range: start_time defaults to one hour
+    ago and end_time to now. The clock is only read if a bound is missing.
+    """
+    if start_time is None or end_time is None:
+        current_time = int(time.time())
+        if start_time is None:
+            start_time = current_time - 3600  # default to one hour ago
+        if end_time is None:
+            end_time = current_time
+    return start_time, end_time
+
+
+def _require_audit_log_page_size(page_size: Optional[int]) -> None:
+    if page_size is not None and (page_size < 0 or page_size > 200):
+        raise ValueError("page_size must be between 0 and 200")
+
+
+def _user_flight_key(arguments: dict) -> Optional[Tuple[str, str]]:
+    # Serialize mutations that target the same user, keyed on the identifier
+    # the request is sent with. Invalid identifiers get no key and are left
+    # for the call itself to reject.
+    try:
+        params = check_user_external_id(arguments.get("user_id"),
+                                        arguments.get("external_id"))
+    except ValueError:
+        return None
+    return next(iter(params.items()))
 
 
 class CoreCommandClient(BaseClient):
@@ -15,25 +54,99 @@ class CoreCommandClient(BaseClient):
 
     def __init__(self,
                  api_key: Optional[str] = None,
-                 token_manager: Optional[VerkadaTokenManager] = None):
+                 token_manager: Optional[VerkadaTokenManager] = None,
+                 user_cache_ttl: Optional[float] = None):
+        """
+        :param api_key: Optional Verkada API key.
+        :param token_manager: Optional token manager to use instead of api_key.
+        :param user_cache_ttl: Optional number of seconds to cache get_user
+            responses for. Disabled by default. Any update_user or
+            delete_user call through this client clears the cache.
+        """
         super().__init__(api_key, token_manager)
+        self._user_cache = TTLCache(maxsize=1024, ttl=user_cache_ttl) \
+            if user_cache_ttl else None
 
     @typechecked
     def get_all_audit_logs(self,
                            start_time: Optional[int] = None,
-                           end_time: Optional[int] = None):
-        params = {
-            "start_time": start_time,
-            "end_time": end_time,
-        }
+                           end_time: Optional[int] = None,
+                           page_size: int = 100) \
+            -> Generator[dict, None, None]:
+        """
+        Lazily iterate through audit log events across all pages.
+
+        Items are yielded as each page arrives, and the next page is fetched
+        in the background while the current one is consumed.
+
+        :param start_time: The start of the time range for requested events, as a Unix timestamp in seconds.
+        :param end_time: The end of the time range for requested events, as a Unix timestamp in seconds.
+        :param page_size: The number of items requested per page (0 to 200). Defaults to 100.
+        :return: A generator of audit log event dictionaries.
+        :raises ValueError: If page_size is not between 0 and 200.
+        """
+        fetch_page, params = self._audit_log_pager(start_time, end_time,
+                                                   page_size)
         return VerkadaRequestManager.iterate_paginated_results(
-            lambda **kwargs: self.get_audit_logs(**kwargs),
+            fetch_page,
             initial_params=params,
             items_key="audit_logs",
-            next_token_key="next_page_token"
+            next_token_key="next_page_token",
+            prefetch=True
         )
 
 
+    @typechecked
+    async def aiter_audit_logs(self,
+                               start_time: Optional[int] = None,
+                               end_time: Optional[int] = None,
+                               page_size: int = 100) \
+            -> AsyncGenerator[dict, None]:
+        """
+        Asynchronously iterate through audit log events across all pages.
+
+        Each page request runs in a worker thread, so the event loop stays
+        free and several windows can be gathered concurrently. The next page
+        is requested as soon as its token is known, while the current page's
+        items are being consumed.
+
+        :param start_time: The start of the time range for requested events, as a Unix timestamp in seconds.
+        :param end_time: The end of the time range for requested events, as a Unix timestamp in seconds.
+        :param page_size: The number of items requested per page (0 to 200). Defaults to 100.
+        :return: An async generator of audit log event dictionaries.
+        :raises ValueError: If page_size is not between 0 and 200.
+        """
+        fetch_page, params = self._audit_log_pager(start_time, end_time,
+                                                   page_size)
+        async for item in VerkadaRequestManager.aiterate_paginated_results(
+                fetch_page,
+                items_key="audit_logs",
+                next_token_key="next_page_token",
+                initial_params=params):
+            yield item
+
+    def _audit_log_pager(self, start_time: Optional[int],
+                         end_time: Optional[int], page_size: int) \
+            -> Tuple[Callable[..., Dict[str, Any]], Dict[str, Any]]:
+        """
+        Returns the page fetcher and first-page params shared by
+        get_all_audit_logs and aiter_audit_logs. The arguments are validated
+        and the default window is frozen once, so every page queries the
+        same range without going through get_audit_logs again.
+        """
+        start_time, end_time = _resolve_audit_log_window(start_time, end_time)
+        _require_audit_log_page_size(page_size)
+        params = non_null_fields(start_time=start_time, end_time=end_time,
+                                 page_size=page_size)
+
+        def fetch_page(**kwargs) -> Dict[str, Any]:
+            # The pager passes page_token=None for the first page; leave it
+            # out so it doesn't end up in the request or its cache keys
+            return self.request_manager.get(AUDIT_LOG_ENDPOINT,
+                                            params=non_null_fields(**kwargs))
+
+        return fetch_page, params
+
     @typechecked
     def get_audit_logs(self,
         start_time: Optional[int] = None,
@@ -53,23 +166,15 @@ class CoreCommandClient(BaseClient):
         :return: JSON response containing audit log events matching the provided filters.
         :raises ValueError: If page_size is not between 0 and 200.
         """
-        current_time = int(time.time())
-        if start_time is None:
-            start_time = current_time - 3600  # default to one hour ago
-        if end_time is None:
-            end_time = current_time
-
-        if page_size is not None and (page_size < 0 or page_size > 200):
-            raise ValueError("page_size must be between 0 and 200")
-
-        params = {
-            "start_time": start_time,
-            "end_time": end_time,
-            "page_token": page_token,
-            "page_size": page_size
-        }
-        # Remove keys with None values.
-        params = {k: v for k, v in params.items() if v is not None}
+        start_time, end_time = _resolve_audit_log_window(start_time, end_time)
+        _require_audit_log_page_size(page_size)
+
+        params = non_null_fields(
+            start_time=start_time,
+            end_time=end_time,
+            page_token=page_token,
+            page_size=page_size
+        )
 
         return self.request_manager.get(AUDIT_LOG_ENDPOINT, params=params)
 
@@ -88,9 +193,19 @@ class CoreCommandClient(BaseClient):
         :raises ValueError: If not exactly one of user_id or external_id is provided.
         """
         params = check_user_external_id(user_id, external_id)
-        return self.request_manager.get(COMMAND_USER_ENDPOINT, params=params)
+        if self._user_cache is None:
+            return self.request_manager.get(COMMAND_USER_ENDPOINT, params=params)
+
+        cache_key = (user_id, external_id)
+        user = self._user_cache.get(cache_key)
+        if user is None:
+            user = self.request_manager.get(COMMAND_USER_ENDPOINT, params=params)
+            self._user_cache.set(cache_key, user)
+        # Hand out a copy so callers can't modify the cached response
+        return copy.deepcopy(user)
 
 
+    @with_backpressure(key=_user_flight_key)
     @typechecked
     def create_user(
         self,
@@ -143,26 +258,52 @@ class CoreCommandClient(BaseClient):
         :raises ValueError: If external_id is an empty string.
         """
 
-        payload = {
-            "company_name": company_name,
-            "department": department,
-            "department_id": department_id,
-            "email": email,
-            "employee_id": employee_id,
-            "employee_title": employee_title,
-            "employee_type": employee_type,
-            "external_id": external_id,
-            "first_name": first_name,
-            "last_name": last_name,
-            "middle_name": middle_name,
-            "phone": phone,
-        }
-        # Remove keys with None values.
-        payload = remove_null_fields(payload)
+        payload = non_null_fields(
+            company_name=company_name,
+            department=department,
+            department_id=department_id,
+            email=email,
+            employee_id=employee_id,
+            employee_title=employee_title,
+            employee_type=employee_type,
+            external_id=external_id,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+            phone=phone,
+        )
 
         return self.request_manager.post(COMMAND_USER_ENDPOINT, payload=payload)
 
 
+    @typechecked
+    def create_users(self,
+                     users: List[Dict[str, Any]],
+                     max_workers: int = 8,
+                     return_exceptions: bool = False) \
+            -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create many users in an organization, issuing the requests
+        concurrently instead of one after another.
+
+        :param users: A list of dictionaries of create_user keyword arguments,
+            one per user (e.g. {"external_id": ..., "email": ...}).
+        :param max_workers: The maximum number of requests in flight at once.
+            create_user calls also share the process-wide limit set by
+            PYKADA_MAX_INFLIGHT (default 8) with every other user mutation,
+            so values above it add no further concurrency.
+        :param return_exceptions: If True, a failure creating one user is
+            returned in that user's position instead of being raised, so the
+            rest of the batch is still reported.
+        :return: The created users, in the same order as users.
+        """
+        return run_concurrently(lambda user: self.create_user(**user),
+                                [(user,) for user in users],
+                                max_workers,
+                                return_exceptions=return_exceptions)
+
+
+    @with_backpressure(key=_user_flight_key)
     @typechecked
     def update_user(
         self,
@@ -204,27 +345,27 @@ class CoreCommandClient(BaseClient):
         """
         params = check_user_external_id(user_id, external_id)
 
-        payload = {
-            "company_name": company_name,
-            "department": department,
-            "department_id": department_id,
-            "email": email,
-            "employee_id": employee_id,
-            "employee_title": employee_title,
-            "employee_type": employee_type,
-            "external_id": external_id,
-            "first_name": first_name,
-            "last_name": last_name,
-            "middle_name": middle_name,
-            "phone": phone,
-        }
-
-        # Remove keys with None values.
-        payload = {k: v for k, v in payload.items() if v is not None}
+        payload = non_null_fields(
+            company_name=company_name,
+            department=department,
+            department_id=department_id,
+            email=email,
+            employee_id=employee_id,
+            employee_title=employee_title,
+            employee_type=employee_type,
+            external_id=external_id,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+            phone=phone,
+        )
 
-        return self.request_manager.put(url=COMMAND_USER_ENDPOINT, params=params, payload=payload)
+        response = self.request_manager.put(url=COMMAND_USER_ENDPOINT, params=params, payload=payload)
+        self._invalidate_user_cache()
+        return response
 
 
+    @with_backpressure(key=_user_flight_key)
     @typechecked
     def delete_user(self,
                     user_id: Optional[str] = None,
@@ -239,8 +380,39 @@ class CoreCommandClient(BaseClient):
         :raises ValueError: If not exactly one of user_id or external_id is provided.
         """
         params = check_user_external_id(user_id, external_id)
-        return self.request_manager.delete(COMMAND_USER_ENDPOINT, params=params)
+        response = self.request_manager.delete(COMMAND_USER_ENDPOINT, params=params)
+        self._invalidate_user_cache()
+        return response
+
+    def _invalidate_user_cache(self) -> None:
+        # A user can be cached under both its user_id and its external_id,
+        # so a mutation through either one drops every cached entry.
+        if self._user_cache is not None:
+            self._user_cache.clear()
+
+
+@typechecked
+async def aiter_audit_logs(start_time: Optional[int] = None, end_time: Optional[int] = None, page_size: int = 100) -> AsyncGenerator[dict, None]:
+    """
+    Asynchronously iterate through audit log events across all pages.
+
+    Each page request runs in a worker thread, so the event loop stays
+    free and several windows can be gathered concurrently. The next page
+    is requested as soon as its token is known, while the current page's
+    items are being consumed.
+
+    :param start_time: The start of the time range for requested events, as a Unix timestamp in seconds.
+    :param end_time: The end of the time range for requested events, as a Unix timestamp in seconds.
+    :param page_size: The number of items requested per page (0 to 200). Defaults to 100.
+    :return: An async generator of audit log event dictionaries.
+    :raises ValueError: If page_size is not between 0 and 200.
+
+    ---
 
+    **Note:** This is a functional wrapper for its equivalent method in the CoreCommandClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use an CoreCommandClient object directly for better performance.
+    """
+    async for item in CoreCommandClient().aiter_audit_logs(start_time, end_time, page_size):
+        yield item
 
 @typechecked
 def create_user(external_id: Optional[str] = None, company_name: Optional[str] = None, department: Optional[str] = None, department_id: Optional[str] = None, email: Optional[str] = None, employee_id: Optional[str] = None, employee_title: Optional[str] = None, employee_type: Optional[str] = None, first_name: Optional[str] = None, last_name: Optional[str] = None, middle_name: Optional[str] = None, phone: Optional[str] = None):
@@ -285,6 +457,29 @@ def create_user(external_id: Optional[str] = None, company_name: Optional[str] =
     """
     return CoreCommandClient().create_user(external_id, company_name, department, department_id, email, employee_id, employee_title, employee_type, first_name, last_name, middle_name, phone)
 
+@typechecked
+def create_users(users: List[Dict[str, Any]], max_workers: int = 8, return_exceptions: bool = False):
+    """
+    Create many users in an organization, issuing the requests
+    concurrently instead of one after another.
+
+    :param users: A list of dictionaries of create_user keyword arguments,
+        one per user (e.g. {"external_id": ..., "email": ...}).
+    :param max_workers: The maximum number of requests in flight at once.
+        create_user calls also share the process-wide limit set by
+        PYKADA_MAX_INFLIGHT (default 8) with every other user mutation, so
+        values above it add no further concurrency.
+    :param return_exceptions: If True, a failure creating one user is
+        returned in that user's position instead of being raised, so the
+        rest of the batch is still reported.
+    :return: The created users, in the same order as users.
+
+    ---
+
+    **Note:** This is a functional wrapper for its equivalent method in the CoreCommandClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use an CoreCommandClient object directly for better performance.
+    """
+    return CoreCommandClient().create_users(users, max_workers, return_exceptions)
+
 @typechecked
 def delete_user(user_id: Optional[str] = None, external_id: Optional[str] = None):
     """
@@ -303,15 +498,24 @@ def delete_user(user_id: Optional[str] = None, external_id: Optional[str] = None
     return CoreCommandClient().delete_user(user_id, external_id)
 
 @typechecked
-def get_all_audit_logs(start_time: Optional[int] = None, end_time: Optional[int] = None):
+def get_all_audit_logs(start_time: Optional[int] = None, end_time: Optional[int] = None, page_size: int = 100) -> Generator[dict, None, None]:
     """
-    No docstring found.
+    Lazily iterate through audit log events across all pages.
+
+    Items are yielded as each page arrives, and the next page is fetched
+    in the background while the current one is consumed.
+
+    :param start_time: The start of the time range for requested events, as a Unix timestamp in seconds.
+    :param end_time: The end of the time range for requested events, as a Unix timestamp in seconds.
+    :param page_size: The number of items requested per page (0 to 200). Defaults to 100.
+    :return: A generator of audit log event dictionaries.
+    :raises ValueError: If page_size is not between 0 and 200.
 
     ---
 
     **Note:** This is a functional wrapper for its equivalent method in the CoreCommandClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use an CoreCommandClient object directly for better performance.
     """
-    return CoreCommandClient().get_all_audit_logs(start_time, end_time)
+    return CoreCommandClient().get_all_audit_logs(start_time, end_time, page_size)
 
 @typechecked
 def get_audit_logs(start_time: Optional[int] = None, end_time: Optional[int] = None, page_token: Optional[str] = None, page_size: Optional[int] = 100):
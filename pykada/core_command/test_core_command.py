@@ -3,6 +3,7 @@ from unittest.mock import patch
 from pykada.core_command import (
     get_audit_logs, get_user, create_user, update_user, delete_user
 )
+from pykada.helpers import USER_EXTERNAL_ID_ERROR_RE
 
 # -----------------------------
 # Audit Log Tests
@@ -37,11 +38,11 @@ def test_get_user_valid_by_external_id(mock_get):
     assert isinstance(result, dict)
 
 def test_get_user_invalid_both_ids_missing():
-    with pytest.raises(ValueError, match="Exactly one of user_id or external_id"):
+    with pytest.raises(ValueError, match=USER_EXTERNAL_ID_ERROR_RE):
         get_user()
 
 def test_get_user_invalid_both_ids_given():
-    with pytest.raises(ValueError, match="Exactly one of user_id or external_id"):
+    with pytest.raises(ValueError, match=USER_EXTERNAL_ID_ERROR_RE):
         get_user(user_id="123", external_id="abc")
 
 
@@ -52,7 +53,7 @@ def test_create_user_valid(mock_post):
     assert isinstance(result, dict)
 
 def test_create_user_invalid_missing_external_id():
-    with pytest.raises(ValueError, match="Exactly one of user_id or external_id"):
+    with pytest.raises(ValueError, match=USER_EXTERNAL_ID_ERROR_RE):
         create_user()
 
 
@@ -63,7 +64,7 @@ def test_update_user_valid(mock_patch):
     assert isinstance(result, dict)
 
 def test_update_user_invalid_missing_both_ids():
-    with pytest.raises(ValueError, match="Exactly one of user_id or external_id"):
+    with pytest.raises(ValueError, match=USER_EXTERNAL_ID_ERROR_RE):
         update_user()
 
 @patch("core_command.delete_request")
@@ -73,5 +74,5 @@ def test_delete_user_valid(mock_delete):
     assert isinstance(result, dict)
 
 def test_delete_user_invalid_missing_ids():
-    with pytest.raises(ValueError, match="Exactly one of user_id or external_id"):
+    with pytest.raises(ValueError, match=USER_EXTERNAL_ID_ERROR_RE):
         delete_user()
@@ -66,5 +66,31 @@ def command_user_crud_test():
 
     cprint("User CRUD test was successful.", "green")
 
+def command_user_batch_test(count: int = 3):
+    """
+    Test function to create several users in one batch and delete them.
+    """
+    external_ids = [generate_random_alphanumeric_string() for _ in range(count)]
+    users = [{"external_id": external_id,
+              "email": f"{external_id}@example.com",
+              "first_name": "Batch",
+              "last_name": f"User {i}"}
+             for i, external_id in enumerate(external_ids)]
+
+    results = create_users(users, return_exceptions=True)
+    try:
+        for external_id, result in zip(external_ids, results):
+            if isinstance(result, Exception):
+                cprint(f"Create user {external_id} failed: {result}", "red")
+            else:
+                print("New User:", result)
+    finally:
+        for external_id, result in zip(external_ids, results):
+            if not isinstance(result, Exception):
+                delete_user(external_id=external_id)
+
+    cprint("User batch create test was successful.", "green")
+
 get_audit_log_test()
 command_user_crud_test()
+command_user_batch_test()
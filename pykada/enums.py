@@ -165,3 +165,21 @@ VALID_IMAGE_RESOLUTION_ENUM = {
     "LOW_RES": "low-res",
     "HI_RES": "hi-res",
 }
+
+# Frozen sets of each enum's values, for validating API arguments with a
+# single hash lookup instead of a linear scan of dict.values().
+WEEKDAY_VALUES = frozenset(WEEKDAY_ENUM.values())
+FREQUENCY_VALUES = frozenset(FREQUENCY_ENUM.values())
+DOOR_STATUS_VALUES = frozenset(DOOR_STATUS_ENUM.values())
+SENSOR_FIELD_VALUES = frozenset(SENSOR_FIELD_ENUM.values())
+VALID_ACCESS_EVENT_TYPES_VALUES = frozenset(VALID_ACCESS_EVENT_TYPES_ENUM.values())
+VALID_CARD_TYPES_VALUES = frozenset(VALID_CARD_TYPES_ENUM.values())
+VALID_OCCUPANCY_TRENDS_INTERVALS_VALUES = frozenset(
+    VALID_OCCUPANCY_TRENDS_INTERVALS_ENUM.values())
+VALID_OCCUPANCY_TRENDS_TYPES_VALUES = frozenset(
+    VALID_OCCUPANCY_TRENDS_TYPES_ENUM.values())
+VALID_CLOUD_BACKUP_VIDEO_QUALITY_VALUES = frozenset(
+    VALID_CLOUD_BACKUP_VIDEO_QUALITY_ENUM.values())
+VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_VALUES = frozenset(
+    VALID_CLOUD_BACKUP_VIDEO_TO_UPLOAD_ENUM.values())
+VALID_IMAGE_RESOLUTION_VALUES = frozenset(VALID_IMAGE_RESOLUTION_ENUM.values())
@@ -1,23 +1,51 @@
-from typeguard import typechecked
-from typing import Dict, Any, List
+import copy
+from functools import lru_cache
 
-from pykada.helpers import require_non_empty_str
+from pykada._typecheck import typechecked
+from typing import Dict, Any, List, Union
+
+from pykada.helpers import non_null_fields, require_non_empty_str, \
+    require_non_empty_str_list, require_positive_int, run_concurrently, \
+    TTLCache
 from pykada.endpoints import HELIX_EVENT_TYPE_ENDPOINT, HELIX_EVENT_ENDPOINT, \
     HELIX_SEARCH_ENDPOINT
 from pykada.verkada_client import BaseClient
 from pykada.verkada_requests import *
 
+# Limits the API places on an event type's schema
+MAX_EVENT_TYPE_ATTRIBUTES = 10
+MAX_ATTRIBUTE_LENGTH = 20
+
 class HelixClient(BaseClient):
     """
     Client for interacting with Verkada's Classic Alarms API.
     This client provides methods to retrieve alarm devices and site information.
     """
+    __slots__ = ("_event_type_cache",)
 
-    @typechecked
     def __init__(self,
                  api_key: Optional[str] = None,
-                 token_manager: Optional[VerkadaTokenManager] = None):
+                 token_manager: Optional[VerkadaTokenManager] = None,
+                 event_type_cache_ttl: Optional[float] = 60):
+        """
+        :param api_key: Optional Verkada API key.
+        :param token_manager: Optional token manager to use instead of api_key.
+        :param event_type_cache_ttl: Number of seconds to cache
+            get_helix_event_types responses for, or None to disable caching.
+            Creating, updating or deleting an event type through this client
+            clears the cache.
+        """
         super().__init__(api_key, token_manager)
+        self._event_type_cache = TTLCache(maxsize=256, ttl=event_type_cache_ttl) \
+            if event_type_cache_ttl else None
+
+    def invalidate_event_type_cache(self) -> None:
+        """
+        Clear cached get_helix_event_types responses, e.g. after event types
+        were changed by another client.
+        """
+        if self._event_type_cache is not None:
+            self._event_type_cache.clear()
 
     @typechecked
     def create_helix_event_type(self, event_schema: Dict[str, str], name: str) -> Dict[
@@ -34,21 +62,30 @@ class HelixClient(BaseClient):
         require_non_empty_str(name, "name")
         if not isinstance(event_schema, dict) or not event_schema:
             raise ValueError("event_schema must be a non-empty dictionary")
-        if len(event_schema) > 10:
+        if len(event_schema) > MAX_EVENT_TYPE_ATTRIBUTES:
             raise ValueError(
-                "The maximum number of attributes per Event Type is 10")
+                "The maximum number of attributes per Event Type is "
+                f"{MAX_EVENT_TYPE_ATTRIBUTES}")
         for key, value in event_schema.items():
+            # Check each attribute in one expression and only work out which
+            # rule was broken once an attribute fails
+            if isinstance(key, str) and isinstance(value, str) \
+                    and key.strip() and len(key) <= MAX_ATTRIBUTE_LENGTH \
+                    and value.strip() and len(value) <= MAX_ATTRIBUTE_LENGTH:
+                continue
             require_non_empty_str(key, "attribute name")
             require_non_empty_str(value, "attribute type")
-            if len(key) > 20 or len(value) > 20:
-                raise ValueError(
-                    "Each attribute name and type must be at most 20 characters long")
+            raise ValueError(
+                "Each attribute name and type must be at most "
+                f"{MAX_ATTRIBUTE_LENGTH} characters long")
 
         payload = {
             "event_schema": event_schema,
             "name": name
         }
-        return self.request_manager.post(HELIX_EVENT_TYPE_ENDPOINT, payload=payload)
+        response = self.request_manager.post(HELIX_EVENT_TYPE_ENDPOINT, payload=payload)
+        self.invalidate_event_type_cache()
+        return response
 
 
     @typechecked
@@ -68,15 +105,29 @@ class HelixClient(BaseClient):
         :return: JSON response containing Helix Event Types.
         :raises ValueError: If event_type_uid or name is provided as an empty string.
         """
-        params: Dict[str, Any] = {}
-        if event_type_uid is not None:
-            require_non_empty_str(event_type_uid, "event_type_uid")
-            params["event_type_uid"] = event_type_uid
-        if name is not None:
-            require_non_empty_str(name, "name")
-            params["name"] = name
-
-        return self.request_manager.get(HELIX_EVENT_TYPE_ENDPOINT, params=params)
+        # Listing every event type is the common call and needs no params
+        params: Optional[Dict[str, Any]] = None
+        if event_type_uid is not None or name is not None:
+            params = {}
+            if event_type_uid is not None:
+                require_non_empty_str(event_type_uid, "event_type_uid")
+                params["event_type_uid"] = event_type_uid
+            if name is not None:
+                require_non_empty_str(name, "name")
+                params["name"] = name
+
+        if self._event_type_cache is None:
+            return self.request_manager.get(HELIX_EVENT_TYPE_ENDPOINT, params=params)
+
+        # Event type schemas rarely change, so lookups made while ingesting
+        # many events are served from the cache
+        cache_key = (event_type_uid, name)
+        event_types = self._event_type_cache.get(cache_key)
+        if event_types is None:
+            event_types = self.request_manager.get(HELIX_EVENT_TYPE_ENDPOINT, params=params)
+            self._event_type_cache.set(cache_key, event_types)
+        # Hand out a copy so callers can't modify the cached response
+        return copy.deepcopy(event_types)
 
 
     @typechecked
@@ -99,8 +150,10 @@ class HelixClient(BaseClient):
 
         payload = {"event_schema": event_schema, "name": name}
         params = {"event_type_uid": event_type_uid}
-        return self.request_manager.patch(HELIX_EVENT_TYPE_ENDPOINT, params=params,
+        response = self.request_manager.patch(HELIX_EVENT_TYPE_ENDPOINT, params=params,
                              payload=payload)
+        self.invalidate_event_type_cache()
+        return response
 
 
     @typechecked
@@ -114,7 +167,9 @@ class HelixClient(BaseClient):
         """
         require_non_empty_str(event_type_uid, "event_type_uid")
         params = {"event_type_uid": event_type_uid}
-        return self.request_manager.delete(HELIX_EVENT_TYPE_ENDPOINT, params=params)
+        response = self.request_manager.delete(HELIX_EVENT_TYPE_ENDPOINT, params=params)
+        self.invalidate_event_type_cache()
+        return response
 
 
     # ---------------------------
@@ -153,22 +208,56 @@ class HelixClient(BaseClient):
         """
         require_non_empty_str(camera_id, "camera_id")
         require_non_empty_str(event_type_uid, "event_type_uid")
-        if not isinstance(time_ms, int) or time_ms <= 0:
-            raise ValueError(
-                "time_ms must be a positive integer representing the event "
-                "epoch time in milliseconds")
+        require_positive_int(time_ms, "time_ms")
 
-        payload = {
-            "camera_id": camera_id,
-            "event_type_uid": event_type_uid,
-            "time_ms": time_ms,
-            "flagged": flagged,
-            "attributes": attributes
-        }
+        payload = non_null_fields(
+            camera_id=camera_id,
+            event_type_uid=event_type_uid,
+            time_ms=time_ms,
+            flagged=flagged,
+            attributes=attributes,
+        )
 
         return self.request_manager.post(HELIX_EVENT_ENDPOINT, payload=payload)
 
 
+    @typechecked
+    def create_helix_events(self,
+                            events: List[Dict[str, Any]],
+                            max_workers: int = 8,
+                            return_exceptions: bool = False) \
+            -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create many Helix Events in Command, issuing the requests
+        concurrently instead of one after another. Useful for backfilling
+        events in bulk.
+
+        :param events: A list of dictionaries of create_helix_event keyword
+            arguments, one per event (e.g. {"camera_id": ...,
+            "event_type_uid": ..., "time_ms": ...}).
+        :param max_workers: The maximum number of requests in flight at once.
+        :param return_exceptions: If True, a failure creating one event is
+            returned in that event's position instead of being raised, so the
+            rest of the batch is still reported.
+        :return: The created events, in the same order as events.
+        :raises ValueError: If return_exceptions is False and any event has
+            an empty camera_id or event_type_uid. No events are sent in that
+            case.
+        """
+        if not return_exceptions:
+            # Reject a bad batch before any event in it is created
+            require_non_empty_str_list(
+                [event.get("camera_id") for event in events], "camera_id")
+            require_non_empty_str_list(
+                [event.get("event_type_uid") for event in events],
+                "event_type_uid")
+
+        return run_concurrently(lambda event: self.create_helix_event(**event),
+                                [(event,) for event in events],
+                                max_workers,
+                                return_exceptions=return_exceptions)
+
+
     @typechecked
     def get_helix_event(self,
                         camera_id: str,
@@ -186,8 +275,7 @@ class HelixClient(BaseClient):
         """
         require_non_empty_str(camera_id, "camera_id")
         require_non_empty_str(event_type_uid, "event_type_uid")
-        if not isinstance(time_ms, int) or time_ms <= 0:
-            raise ValueError("time_ms must be a positive integer")
+        require_positive_int(time_ms, "time_ms")
 
         params = {
             "camera_id": camera_id,
@@ -229,13 +317,9 @@ class HelixClient(BaseClient):
         """
         require_non_empty_str(camera_id, "camera_id")
         require_non_empty_str(event_type_uid, "event_type_uid")
-        if not isinstance(time_ms, int) or time_ms <= 0:
-            raise ValueError(
-                "time_ms must be a positive integer representing the event epoch time in milliseconds")
+        require_positive_int(time_ms, "time_ms")
 
-        attributes: Dict[str, Any] = {}
-        if extra_attributes:
-            attributes.update(extra_attributes)
+        attributes: Dict[str, Any] = extra_attributes or {}
 
         params = {
             "camera_id": camera_id,
@@ -261,8 +345,7 @@ class HelixClient(BaseClient):
         """
         require_non_empty_str(camera_id, "camera_id")
         require_non_empty_str(event_type_uid, "event_type_uid")
-        if not isinstance(time_ms, int) or time_ms <= 0:
-            raise ValueError("time_ms must be a positive integer")
+        require_positive_int(time_ms, "time_ms")
 
         params = {"camera_id": camera_id, "time_ms": time_ms,
                   "event_type_uid": event_type_uid}
@@ -311,17 +394,14 @@ class HelixClient(BaseClient):
         # Validate camera_ids: must be non-empty list of non-empty strings.
         if not camera_ids:
             raise ValueError("camera_ids must be a non-empty list of strings")
-        for idx, cam_id in enumerate(camera_ids):
-            require_non_empty_str(cam_id, f"camera_ids[{idx}]")
+        require_non_empty_str_list(camera_ids, "camera_ids")
 
         # Validate event_type_uid.
         require_non_empty_str(event_type_uid, "event_type_uid")
 
         # Validate time range.
-        if not isinstance(start_time_ms, int) or start_time_ms <= 0:
-            raise ValueError("start_time_ms must be a positive integer")
-        if not isinstance(end_time_ms, int) or end_time_ms <= 0:
-            raise ValueError("end_time_ms must be a positive integer")
+        require_positive_int(start_time_ms, "start_time_ms")
+        require_positive_int(end_time_ms, "end_time_ms")
         if start_time_ms > end_time_ms:
             raise ValueError(
                 "start_time_ms must be less than or equal to end_time_ms")
@@ -329,8 +409,7 @@ class HelixClient(BaseClient):
         # Validate keywords: must be a list of non-empty strings.
         if not isinstance(keywords, list):
             raise ValueError("keywords must be a list")
-        for idx, keyword in enumerate(keywords):
-            require_non_empty_str(keyword, f"keywords[{idx}]")
+        require_non_empty_str_list(keywords, "keywords")
 
         # Construct the base filter object from the required parameters.
         base_filter = {
@@ -343,14 +422,27 @@ class HelixClient(BaseClient):
         }
 
         # Combine with any additional filters if provided.
-        filters = [base_filter]
-        if attribute_filters is not None:
-            filters.extend(attribute_filters)
+        filters = [base_filter, *attribute_filters] if attribute_filters \
+            else [base_filter]
 
         payload = {"attribute_filters": filters}
         return self.request_manager.post(HELIX_SEARCH_ENDPOINT, payload=payload)
 
 
+
+@lru_cache(maxsize=1)
+def _default_client() -> HelixClient:
+    """
+    Returns the HelixClient behind the helix functional wrappers, building it
+    on the first call. The client keeps its event type cache between
+    wrapper calls, so lookups made while ingesting many events are served
+    from it. lru_cache does not lock around the first call: threads racing on
+    it may each build a client, and only one of them, along with its event
+    type cache, is kept. Call _default_client.cache_clear() after changing
+    VERKADA_API_KEY to start over with a new client.
+    """
+    return HelixClient()
+
 @typechecked
 def create_helix_event(camera_id: str, event_type_uid: str, time_ms: int, flagged: Optional[bool] = False, attributes: Optional[Dict[str, Any]] = None):
     """
@@ -376,9 +468,9 @@ def create_helix_event(camera_id: str, event_type_uid: str, time_ms: int, flagge
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().create_helix_event(camera_id, event_type_uid, time_ms, flagged, attributes)
+    return _default_client().create_helix_event(camera_id, event_type_uid, time_ms, flagged, attributes)
 
 @typechecked
 def create_helix_event_type(event_schema: Dict[str, str], name: str):
@@ -393,9 +485,34 @@ def create_helix_event_type(event_schema: Dict[str, str], name: str):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
+    """
+    return _default_client().create_helix_event_type(event_schema, name)
+
+@typechecked
+def create_helix_events(events: List[Dict[str, Any]], max_workers: int = 8, return_exceptions: bool = False):
+    """
+    Create many Helix Events in Command, issuing the requests
+    concurrently instead of one after another. Useful for backfilling
+    events in bulk.
+
+    :param events: A list of dictionaries of create_helix_event keyword
+        arguments, one per event (e.g. {"camera_id": ...,
+        "event_type_uid": ..., "time_ms": ...}).
+    :param max_workers: The maximum number of requests in flight at once.
+    :param return_exceptions: If True, a failure creating one event is
+        returned in that event's position instead of being raised, so the
+        rest of the batch is still reported.
+    :return: The created events, in the same order as events.
+    :raises ValueError: If return_exceptions is False and any event has
+        an empty camera_id or event_type_uid. No events are sent in that
+        case.
+
+    ---
+
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().create_helix_event_type(event_schema, name)
+    return _default_client().create_helix_events(events, max_workers, return_exceptions)
 
 @typechecked
 def delete_helix_event(camera_id: str, time_ms: int, event_type_uid: str):
@@ -410,9 +527,9 @@ def delete_helix_event(camera_id: str, time_ms: int, event_type_uid: str):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().delete_helix_event(camera_id, time_ms, event_type_uid)
+    return _default_client().delete_helix_event(camera_id, time_ms, event_type_uid)
 
 @typechecked
 def delete_helix_event_type(event_type_uid: str):
@@ -425,9 +542,9 @@ def delete_helix_event_type(event_type_uid: str):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().delete_helix_event_type(event_type_uid)
+    return _default_client().delete_helix_event_type(event_type_uid)
 
 @typechecked
 def get_helix_event(camera_id: str, time_ms: int, event_type_uid: str):
@@ -442,9 +559,9 @@ def get_helix_event(camera_id: str, time_ms: int, event_type_uid: str):
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().get_helix_event(camera_id, time_ms, event_type_uid)
+    return _default_client().get_helix_event(camera_id, time_ms, event_type_uid)
 
 @typechecked
 def get_helix_event_types(event_type_uid: Optional[str] = None, name: Optional[str] = None):
@@ -461,9 +578,9 @@ def get_helix_event_types(event_type_uid: Optional[str] = None, name: Optional[s
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().get_helix_event_types(event_type_uid, name)
+    return _default_client().get_helix_event_types(event_type_uid, name)
 
 @typechecked
 def search_helix_events(camera_ids: List[str], end_time_ms: int, event_type_uid: str, flagged: bool, keywords: List[str], start_time_ms: int, attribute_filters: Optional[List[Dict[str, Any]]] = None):
@@ -497,9 +614,9 @@ def search_helix_events(camera_ids: List[str], end_time_ms: int, event_type_uid:
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().search_helix_events(camera_ids, end_time_ms, event_type_uid, flagged, keywords, start_time_ms, attribute_filters)
+    return _default_client().search_helix_events(camera_ids, end_time_ms, event_type_uid, flagged, keywords, start_time_ms, attribute_filters)
 
 @typechecked
 def update_helix_event(camera_id: str, time_ms: int, event_type_uid: str, flagged: bool, extra_attributes: Optional[Dict[str, Any]] = None):
@@ -526,9 +643,9 @@ def update_helix_event(camera_id: str, time_ms: int, event_type_uid: str, flagge
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().update_helix_event(camera_id, time_ms, event_type_uid, flagged, extra_attributes)
+    return _default_client().update_helix_event(camera_id, time_ms, event_type_uid, flagged, extra_attributes)
 
 @typechecked
 def update_helix_event_type(event_type_uid: str, event_schema: Dict[str, str], name: str):
@@ -543,6 +660,6 @@ def update_helix_event_type(event_type_uid: str, event_schema: Dict[str, str], n
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a HelixClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the HelixClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a HelixClient object directly.
     """
-    return HelixClient().update_helix_event_type(event_type_uid, event_schema, name)
+    return _default_client().update_helix_event_type(event_type_uid, event_schema, name)
@@ -0,0 +1,85 @@
+import datetime
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import pykada.helix as helix
+from pykada.api_tokens import VerkadaTokenManager
+from pykada.verkada_requests import VerkadaRequestManager
+
+
+class FakeTransport(BaseAdapter):
+    """
+    Transport adapter that answers requests from registered (method, url)
+    responses instead of the network, and records every request it sends.
+    Requests to unregistered URLs raise ConnectionError.
+    """
+    def __init__(self):
+        super().__init__()
+        self._responses = {}
+        self.calls = []
+
+    def add(self, method: str, url: str, json=None, status: int = 200):
+        self._responses[(method.upper(), url)] = (status, json)
+
+    def reset(self):
+        self._responses.clear()
+        self.calls.clear()
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        url = request.url.split("?", 1)[0]
+        try:
+            status, body = self._responses[(request.method, url)]
+        except KeyError:
+            raise requests.exceptions.ConnectionError(
+                f"No response registered for {request.method} {url}",
+                request=request)
+
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_http():
+    """
+    Routes the helix functional wrappers through a client whose Session uses
+    a FakeTransport, once per module. Tests register the responses they
+    expect with mock_http.add(method, url, json=...).
+    """
+    token_manager = VerkadaTokenManager(api_key="test-key")
+    # Skip the token request, which is sent outside the Session
+    token_manager._token = "test-token"
+    token_manager._token_expiry = datetime.datetime.max.replace(
+        tzinfo=datetime.timezone.utc)
+
+    transport = FakeTransport()
+    session = requests.Session()
+    session.mount("https://", transport)
+    session.mount("http://", transport)
+
+    client = helix.HelixClient(token_manager=token_manager,
+                               event_type_cache_ttl=None)
+    client.request_manager = VerkadaRequestManager(
+        token_manager=token_manager, session=session)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(helix, "_default_client", lambda: client)
+        yield transport
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_http(mock_http):
+    yield
+    mock_http.reset()
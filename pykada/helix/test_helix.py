@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import patch
+from pykada.endpoints import HELIX_EVENT_TYPE_ENDPOINT, HELIX_EVENT_ENDPOINT, \
+    HELIX_SEARCH_ENDPOINT
 from pykada.helix import (
     create_helix_event_type, get_helix_event_types, update_helix_event_type,
     delete_helix_event_type, create_helix_event, get_helix_event,
@@ -20,11 +21,10 @@ def test_create_helix_event_type_invalid_schema_raises():
     with pytest.raises(ValueError):
         create_helix_event_type({"a"*21: "string"}, "eventName")
 
-@patch("helix.post_request")
-def test_create_helix_event_type_valid(mock_post):
-    mock_post.return_value = {"success": True}
+def test_create_helix_event_type_valid(mock_http):
+    mock_http.add("POST", HELIX_EVENT_TYPE_ENDPOINT, json={"success": True})
     result = create_helix_event_type({"item": "string"}, "eventName")
-    assert isinstance(result, dict)
+    assert result == {"success": True}
 
 def test_get_helix_event_types_empty_params():
     with pytest.raises(ValueError):
@@ -32,22 +32,19 @@ def test_get_helix_event_types_empty_params():
     with pytest.raises(ValueError):
         get_helix_event_types(name="")
 
-@patch("helix.get_request")
-def test_get_helix_event_types_valid(mock_get):
-    mock_get.return_value = {"event_types": []}
-    assert isinstance(get_helix_event_types(), dict)
+def test_get_helix_event_types_valid(mock_http):
+    mock_http.add("GET", HELIX_EVENT_TYPE_ENDPOINT, json={"event_types": []})
+    assert get_helix_event_types() == {"event_types": []}
 
-@patch("helix.patch_request")
-def test_update_helix_event_type_valid(mock_patch):
-    mock_patch.return_value = {"success": True}
+def test_update_helix_event_type_valid(mock_http):
+    mock_http.add("PATCH", HELIX_EVENT_TYPE_ENDPOINT, json={"success": True})
     result = update_helix_event_type("uid123", {"item": "string"}, "newName")
-    assert isinstance(result, dict)
+    assert result == {"success": True}
 
-@patch("helix.delete_request")
-def test_delete_helix_event_type_valid(mock_delete):
-    mock_delete.return_value = {"deleted": True}
+def test_delete_helix_event_type_valid(mock_http):
+    mock_http.add("DELETE", HELIX_EVENT_TYPE_ENDPOINT, json={"deleted": True})
     result = delete_helix_event_type("uid123")
-    assert isinstance(result, dict)
+    assert result == {"deleted": True}
 
 # -----------------------------
 # Helix Event Tests
@@ -61,11 +58,10 @@ def test_create_helix_event_invalid_inputs():
     with pytest.raises(ValueError):
         create_helix_event("cam", "uid", -1)
 
-@patch("helix.post_request")
-def test_create_helix_event_valid(mock_post):
-    mock_post.return_value = {"created": True}
+def test_create_helix_event_valid(mock_http):
+    mock_http.add("POST", HELIX_EVENT_ENDPOINT, json={"created": True})
     result = create_helix_event("cam123", "uid456", 1234567890)
-    assert isinstance(result, dict)
+    assert result == {"created": True}
 
 def test_get_helix_event_invalid_inputs():
     with pytest.raises(ValueError):
@@ -75,23 +71,20 @@ def test_get_helix_event_invalid_inputs():
     with pytest.raises(ValueError):
         get_helix_event("cam", 1234567890, "")
 
-@patch("helix.get_request")
-def test_get_helix_event_valid(mock_get):
-    mock_get.return_value = {"event": {}}
+def test_get_helix_event_valid(mock_http):
+    mock_http.add("GET", HELIX_EVENT_ENDPOINT, json={"event": {}})
     result = get_helix_event("cam123", 1234567890, "uid456")
-    assert isinstance(result, dict)
+    assert result == {"event": {}}
 
-@patch("helix.patch_request")
-def test_update_helix_event_valid(mock_patch):
-    mock_patch.return_value = {"updated": True}
+def test_update_helix_event_valid(mock_http):
+    mock_http.add("PATCH", HELIX_EVENT_ENDPOINT, json={"updated": True})
     result = update_helix_event("cam", 1234567890, "uid", flagged=True)
-    assert isinstance(result, dict)
+    assert result == {"updated": True}
 
-@patch("helix.delete_request")
-def test_delete_helix_event_valid(mock_delete):
-    mock_delete.return_value = {"deleted": True}
+def test_delete_helix_event_valid(mock_http):
+    mock_http.add("DELETE", HELIX_EVENT_ENDPOINT, json={"deleted": True})
     result = delete_helix_event("cam", 1234567890, "uid")
-    assert isinstance(result, dict)
+    assert result == {"deleted": True}
 
 # -----------------------------
 # Helix Event Search Tests
@@ -111,8 +104,7 @@ def test_search_helix_events_invalid_inputs():
     with pytest.raises(ValueError):
         search_helix_events(["cam"], 1000, "uid", True, [""], 500)
 
-@patch("helix.post_request")
-def test_search_helix_events_valid(mock_post):
-    mock_post.return_value = {"results": []}
+def test_search_helix_events_valid(mock_http):
+    mock_http.add("POST", HELIX_SEARCH_ENDPOINT, json={"results": []})
     result = search_helix_events(["cam123"], 2000, "uid123", True, ["motion"], 1000)
-    assert isinstance(result, dict)
+    assert result == {"results": []}
@@ -1,24 +1,57 @@
 import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 import random
 import re
 import string
+import threading
+import time
 import typing
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
-from typeguard import typechecked
 import inspect
+import logging
 
 
 def remove_null_fields(obj: dict):
     """
-    Removes fields with a value of None from a dictionary.
+    Removes fields with a value of None from a dictionary. If obj has no
+    None values it is returned as is rather than copied, so callers that
+    need a separate dictionary to modify must copy the result themselves.
     :param obj:
     :return: A dictionary with no values of None
     """
-    return {k: v for k, v in obj.items() if v is not None}
+    for v in obj.values():
+        if v is None:
+            return {k: v for k, v in obj.items() if v is not None}
+    return obj
+
+
+def remove_null_fields_inplace(obj: dict):
+    """
+    Removes fields with a value of None from a dictionary in place, without
+    allocating a new dictionary. Only use this on dictionaries the caller
+    owns, such as params built inline for a single request.
+    :param obj:
+    :return: The same dictionary, with no values of None
+    """
+    for k in [k for k, v in obj.items() if v is None]:
+        del obj[k]
+    return obj
+
+
+def non_null_fields(**fields):
+    """
+    Builds a dictionary from keyword arguments, leaving out any whose value
+    is None. Use this to build params/payloads directly instead of building
+    a full dictionary and then passing it through remove_null_fields.
+    :param fields:
+    :return: A dictionary with no values of None
+    """
+    return {k: v for k, v in fields.items() if v is not None}
 
 
-@typechecked
 def require_non_empty_str(value: str, field_name: str, idx: Optional[int] = None) -> None:
     """
     Ensures that a value is a non-empty string.
@@ -28,6 +61,9 @@ def require_non_empty_str(value: str, field_name: str, idx: Optional[int] = None
     :param idx: Optional index for context.
     :raises ValueError: If value is not a non-empty string.
     """
+    # Fast path for the common case of a plain, valid str
+    if type(value) is str and value.strip():
+        return
     if not isinstance(value, str) or not value.strip():
         msg = f"{field_name} must be a non-empty string"
         if idx is not None:
@@ -35,6 +71,43 @@ def require_non_empty_str(value: str, field_name: str, idx: Optional[int] = None
         raise ValueError(msg)
 
 
+
+def require_non_empty_str_list(values: typing.List[str], field_name: str) -> None:
+    """
+    Ensures that every item in a list is a non-empty string. Valid lists are
+    checked in a single scan without tracking indexes; the index and error
+    message are only worked out once a bad item is found.
+
+    :param values: The list of strings to check.
+    :param field_name: The name of the list for error messaging.
+    :raises ValueError: If any item is not a non-empty string.
+    """
+    if all(isinstance(value, str) and value.strip() for value in values):
+        return
+    # Only look for the offending index once we know there is one
+    bad_idx = next(idx for idx, value in enumerate(values)
+                   if not isinstance(value, str) or not value.strip())
+    raise ValueError(f"{field_name}[{bad_idx}] must be a non-empty string")
+
+
+def require_positive_int(value: int, field_name: str) -> None:
+    """
+    Ensures that a value is a positive integer.
+
+    :param value: The integer value to check.
+    :param field_name: The name of the field for error messaging.
+    :raises ValueError: If value is not a positive integer.
+    """
+    if not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{field_name} must be a positive integer")
+
+# Raised whenever a call needs exactly one of user_id or external_id.
+USER_EXTERNAL_ID_ERROR = ("Exactly one of user_id or external_id must be "
+                          "provided, not both or neither.")
+# Precompiled for pytest.raises(..., match=...) in tests.
+USER_EXTERNAL_ID_ERROR_RE = re.compile(re.escape(USER_EXTERNAL_ID_ERROR))
+
+
 def check_user_external_id(user_id: str = None, external_id:str = None):
     """
     Check if only one of user_id or external_id are provided.
@@ -47,12 +120,12 @@ def check_user_external_id(user_id: str = None, external_id:str = None):
     :type external_id: Optional[str]
     :return: A dictionary containing the provided identifier.
     """
-    if (user_id is None and external_id is None) or (user_id is not None and external_id is not None):
-        raise ValueError("Exactly one of user_id or external_id must be provided, not both or neither.")
+    # Exactly one identifier is set iff their None-ness differs
+    if (user_id is None) == (external_id is None):
+        raise ValueError(USER_EXTERNAL_ID_ERROR)
 
-    params = {"user_id": user_id, "external_id": external_id}
-    params = remove_null_fields(params)
-    return params
+    return {"user_id": user_id} if external_id is None \
+        else {"external_id": external_id}
 
 
 def verify_csv_columns(file_path: str, expected_headers_list: typing.List[str]) -> bool:
@@ -70,91 +143,196 @@ def verify_csv_columns(file_path: str, expected_headers_list: typing.List[str])
         True if the file exists and has the specified columns,
         False otherwise.
     """
-    # Convert the expected headers list to a set for efficient comparison (order doesn't matter)
-    expected_headers_set: typing.Set[str] = set(expected_headers_list)
     expected_column_count = len(expected_headers_list)
 
     if not os.path.exists(file_path):
-        print(f"Error: File not found at '{file_path}'")
+        logging.error("File not found at '%s'", file_path)
         return False
 
     if expected_column_count == 0:
-        print("Error: expected_headers_list cannot be empty.")
+        logging.error("expected_headers_list cannot be empty.")
         return False
 
+    # Convert the expected headers list to a set for efficient comparison
+    # (order doesn't matter), once the inputs are known to be usable
+    expected_headers_set: typing.FrozenSet[str] = frozenset(expected_headers_list)
+
     try:
-        with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-
-            # Read the header row
-            try:
-                headers = next(reader)
-            except StopIteration:
-                print(f"Error: File '{file_path}' is empty or has no header row.")
-                return False
-            except Exception as e:
-                 print(f"Error reading header from '{file_path}': {e}")
-                 return False
-
-            # Check if the number of columns matches the expected count
-            if len(headers) != expected_column_count:
-                print(f"Error: File '{file_path}' does not have the expected number of columns.")
-                print(f"Expected {expected_column_count}, Found {len(headers)}.")
-                print(f"Columns found: {headers}")
-                return False
-
-            # Check if the column names are the expected ones (order doesn't matter)
-            actual_headers_set = set(headers)
-
-            if actual_headers_set != expected_headers_set:
-                print(f"Error: File '{file_path}' has incorrect column names.")
-                print(f"Expected names: {expected_headers_set}, Found names: {actual_headers_set}")
-                return False
-
-            # If all checks pass
-            print(f"File '{file_path}' successfully verified: has the expected {expected_column_count} columns.")
-            return True
+        # Keyed on modification time and size, so an edited file is re-read
+        stat = os.stat(file_path)
+        try:
+            header = _read_csv_header(file_path, stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            logging.error("Error reading header from '%s': %s", file_path, e)
+            return False
+
+        if header is None:
+            logging.error("File '%s' is empty or has no header row.", file_path)
+            return False
+        headers = list(header)
+
+        # Check if the number of columns matches the expected count
+        if len(headers) != expected_column_count:
+            logging.error(
+                "File '%s' does not have the expected number of columns. "
+                "Expected %d, Found %d. Columns found: %s",
+                file_path, expected_column_count, len(headers), headers)
+            return False
+
+        # Check if the column names are the expected ones (order doesn't
+        # matter). Stop at the first unexpected name; if there is none, the
+        # names still differ when a header is repeated in place of another.
+        if any(h not in expected_headers_set for h in headers) \
+                or len(set(headers)) != len(expected_headers_set):
+            logging.error(
+                "File '%s' has incorrect column names. Expected names: %s, "
+                "Found names: %s",
+                file_path, set(expected_headers_set), set(headers))
+            return False
+
+        # If all checks pass
+        logging.debug("File '%s' successfully verified: has the expected %d columns.",
+                      file_path, expected_column_count)
+        return True
 
     except Exception as e:
         # Catch other potential CSV reading errors
-        print(f"An unexpected error occurred while processing '{file_path}': {e}")
+        logging.error("An unexpected error occurred while processing '%s': %s",
+                      file_path, e)
         return False
 
 
+@lru_cache(maxsize=256)
+def _read_csv_header(file_path: str, mtime_ns: int, size: int) \
+        -> Optional[typing.Tuple[str, ...]]:
+    """
+    Returns the header row of a CSV file, or None if the file is empty.
+    Only the first row is parsed. mtime_ns and size are part of the cache key
+    so repeated checks of an unchanged file skip opening it again.
+    """
+    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+        header = next(csv.reader(csvfile), None)
+    return tuple(header) if header is not None else None
+
+
+_ALPHANUMERIC_CHARACTERS = string.ascii_letters + string.digits
+
+
 def generate_random_alphanumeric_string(length=16):
     """
     Generate a random alphanumeric string of the specified length.
     """
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    return ''.join(random.choices(_ALPHANUMERIC_CHARACTERS, k=length))
 
 
 def generate_random_numeric_string(length=16):
     """
     Generate a random numeric string of the specified length.
     """
-    characters = string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    return ''.join(random.choices(string.digits, k=length))
+
 
 
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TIME_PATTERN = re.compile(r"^(0[0-9]|1[0-9]|2[0-3]):([0-5][0-9])$")
+
 
 def is_valid_date(date_str: str) -> bool:
     """
     Validates that a date string is in YYYY-MM-DD format.
     """
-    pattern = r"^\d{4}-\d{2}-\d{2}$"
-    return bool(re.match(pattern, date_str))
+    return _DATE_PATTERN.match(date_str) is not None
 
 
 def is_valid_time(time_str: str) -> bool:
     """
     Validates that a time string is in HH:MM format (00:00 to 23:59) with required leading zeros.
     """
-    pattern = r"^(0[0-9]|1[0-9]|2[0-3]):([0-5][0-9])$"
-    return bool(re.match(pattern, time_str))
+    return _TIME_PATTERN.match(time_str) is not None
+
 
 
 
+def run_concurrently(func: typing.Callable[..., typing.Any],
+                     args_list: typing.Iterable[tuple],
+                     max_workers: int = 8,
+                     return_exceptions: bool = False) -> typing.List[typing.Any]:
+    """
+    Calls func once per argument tuple on a thread pool and returns the
+    results in the same order as args_list. Useful for fanning out
+    independent single-item API calls, since each call spends almost all
+    of its time waiting on the network.
+
+    :param func: The function to call.
+    :param args_list: An iterable of positional argument tuples for func.
+    :param max_workers: The maximum number of calls in flight at once.
+    :param return_exceptions: If True, an exception raised by one call is
+        returned in that call's position instead of being raised, so the
+        other results are still available.
+    :return: A list of the return values of func, in order.
+    :raises Exception: Re-raises the first exception raised by func, unless
+        return_exceptions is True.
+    """
+    args_list = list(args_list)
+    if not args_list:
+        return []
+
+    def call(args):
+        if not return_exceptions:
+            return func(*args)
+        try:
+            return func(*args)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        return list(executor.map(call, args_list))
+
+
+class TTLCache:
+    """
+    A small thread-safe mapping whose entries expire ttl seconds after they
+    are set. Once maxsize entries are stored, the oldest entry is evicted to
+    make room for a new one.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[typing.Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: typing.Hashable, default=None):
+        """
+        Returns the value stored for key, or default if it is missing or
+        has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: typing.Hashable, value) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                self._entries.popitem(last=False)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: typing.Hashable, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 def copy_docstring_from(source_func, note=None):
     """
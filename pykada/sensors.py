@@ -1,10 +1,11 @@
-import numpy as np
+from functools import lru_cache
+
 from typeguard import typechecked
 from typing import List, Dict, Any, Generator
 
 from pykada.endpoints import SENSOR_ALERT_ENDPOINT, SENSOR_DATA_ENDPOINT
-from pykada.helpers import remove_null_fields
-from pykada.enums import SENSOR_FIELD_ENUM
+from pykada.helpers import non_null_fields
+from pykada.enums import SENSOR_FIELD_ENUM, SENSOR_FIELD_VALUES
 from pykada.verkada_client import BaseClient
 from pykada.verkada_requests import *
 
@@ -15,9 +16,9 @@ def check_sensor_fields(fields):
     """
     if not fields:
         return
-    invalid_fields = np.setdiff1d(fields, list(SENSOR_FIELD_ENUM.values()))
-    if len(invalid_fields) > 0:
-        raise ValueError(f"Sensor field types {invalid_fields} are not in the"
+    invalid_fields = set(fields).difference(SENSOR_FIELD_VALUES)
+    if invalid_fields:
+        raise ValueError(f"Sensor field types {sorted(invalid_fields)} are not in the "
                          f"list of valid types: "
                          f"{list(SENSOR_FIELD_ENUM.values())}")
 
@@ -63,7 +64,7 @@ class SensorsClient(BaseClient):
         }
 
         return VerkadaRequestManager.iterate_paginated_results(
-            lambda **kwargs: self.get_sensor_alerts(**kwargs),
+            lambda **kwargs: self._get_sensor_alerts_page(**kwargs),
             initial_params=params,
             next_token_key="page_cursor",
             items_key="alert_events"
@@ -94,18 +95,28 @@ class SensorsClient(BaseClient):
             raise ValueError("device_ids must be a non-empty list")
 
         check_sensor_fields(fields)
-
-        params = {
-            "device_ids": ",".join(device_id for device_id in device_ids),
-            "start_time": start_time,
-            "end_time": end_time,
-            "page_size": page_size,
-            "page_token": page_token if page_token else None,
-            "fields": ",".join(field for field in fields) if fields else None,
-        }
-
-        # Remove keys with a value of None.
-        params = remove_null_fields(params)
+        return self._get_sensor_alerts_page(device_ids, start_time, end_time,
+                                            page_size, page_token, fields)
+
+    def _get_sensor_alerts_page(self, device_ids: List[str],
+                                start_time: Optional[int] = None,
+                                end_time: Optional[int] = None,
+                                page_size: Optional[int] = None,
+                                page_token: Optional[str] = None,
+                                fields: Optional[List[str]] = None) -> Dict:
+        """
+        Fetches one page of sensor alerts without validating the arguments.
+        get_all_sensor_alerts validates them once and then pages through
+        this, rather than re-checking the same fields for every page.
+        """
+        params = non_null_fields(
+            device_ids=",".join(device_ids),
+            start_time=start_time,
+            end_time=end_time,
+            page_size=page_size,
+            page_token=page_token or None,
+            fields=",".join(fields) if fields else None,
+        )
         return self.request_manager.get(SENSOR_ALERT_ENDPOINT, params=params)
 
     def get_all_sensor_data(
@@ -136,18 +147,16 @@ class SensorsClient(BaseClient):
 
         check_sensor_fields(fields)
 
-        params = {
-            "device_id": device_id,
-            "start_time": start_time,
-            "end_time": end_time,
-            "fields": fields,
-            "interval": interval if interval else None,
-        }
-
-        params = remove_null_fields(params)
+        params = non_null_fields(
+            device_id=device_id,
+            start_time=start_time,
+            end_time=end_time,
+            fields=fields,
+            interval=interval or None,
+        )
 
         return VerkadaRequestManager.iterate_paginated_results(
-            lambda **kwargs: self.get_sensor_data(**kwargs),
+            lambda **kwargs: self._get_sensor_data_page(**kwargs),
             initial_params=params,
             next_token_key="page_cursor",
             items_key="data"
@@ -184,20 +193,46 @@ class SensorsClient(BaseClient):
         """
 
         check_sensor_fields(fields)
-
-        params = {
-            "device_id": device_id,
-            "start_time": start_time,
-            "end_time": end_time,
-            "page_size": page_size,
-            "page_token": page_token if page_token else None,
-            "fields": ",".join(str(field) for field in fields) if fields else None,
-            "interval": interval if interval else None,
-        }
-        params = remove_null_fields(params)
+        return self._get_sensor_data_page(device_id, start_time, end_time,
+                                          page_size, page_token, fields,
+                                          interval)
+
+    def _get_sensor_data_page(self, device_id: str,
+                              start_time: Optional[int] = None,
+                              end_time: Optional[int] = None,
+                              page_size: Optional[int] = None,
+                              page_token: Optional[str] = None,
+                              fields: Optional[List[str]] = None,
+                              interval: Optional[str] = None) -> Dict:
+        """
+        Fetches one page of sensor data without validating the arguments.
+        get_all_sensor_data validates them once and then pages through this,
+        rather than re-checking the same fields for every page.
+        """
+        params = non_null_fields(
+            device_id=device_id,
+            start_time=start_time,
+            end_time=end_time,
+            page_size=page_size,
+            page_token=page_token or None,
+            fields=",".join(fields) if fields else None,
+            interval=interval or None,
+        )
         return self.request_manager.get(SENSOR_DATA_ENDPOINT, params=params)
 
 
+@lru_cache(maxsize=1)
+def _default_client() -> SensorsClient:
+    """
+    Returns the SensorsClient the sensor alert and data wrappers call
+    through, building it on the first call so the default token and request
+    manager lookup happens once. Concurrent first calls can each build a
+    client; this is harmless because they all share the default request
+    manager. Call _default_client.cache_clear() to pick up a changed
+    VERKADA_API_KEY.
+    """
+    return SensorsClient()
+
 @typechecked
 def get_all_sensor_alerts(device_ids: List[str], start_time: Optional[int] = None, end_time: Optional[int] = None, fields: Optional[List[str]] = None):
     """
@@ -212,9 +247,9 @@ def get_all_sensor_alerts(device_ids: List[str], start_time: Optional[int] = Non
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a SensorsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a SensorsClient object directly.
     """
-    return SensorsClient().get_all_sensor_alerts(device_ids, start_time, end_time, fields)
+    return _default_client().get_all_sensor_alerts(device_ids, start_time, end_time, fields)
 
 @typechecked
 def get_all_sensor_data(device_id: str, start_time: Optional[int] = None, end_time: Optional[int] = None, fields: Optional[List[str]] = None, interval: Optional[str] = None):
@@ -237,9 +272,9 @@ def get_all_sensor_data(device_id: str, start_time: Optional[int] = None, end_ti
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a SensorsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a SensorsClient object directly.
     """
-    return SensorsClient().get_all_sensor_data(device_id, start_time, end_time, fields, interval)
+    return _default_client().get_all_sensor_data(device_id, start_time, end_time, fields, interval)
 
 @typechecked
 def get_sensor_alerts(device_ids: List[str], start_time: Optional[int] = None, end_time: Optional[int] = None, page_size: Optional[int] = None, page_token: Optional[str] = None, fields: Optional[List[str]] = None):
@@ -257,9 +292,9 @@ def get_sensor_alerts(device_ids: List[str], start_time: Optional[int] = None, e
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a SensorsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a SensorsClient object directly.
     """
-    return SensorsClient().get_sensor_alerts(device_ids, start_time, end_time, page_size, page_token, fields)
+    return _default_client().get_sensor_alerts(device_ids, start_time, end_time, page_size, page_token, fields)
 
 @typechecked
 def get_sensor_data(device_id: str, start_time: Optional[int] = None, end_time: Optional[int] = None, page_size: Optional[int] = None, page_token: Optional[str] = None, fields: Optional[List[str]] = None, interval: Optional[str] = None):
@@ -284,6 +319,6 @@ def get_sensor_data(device_id: str, start_time: Optional[int] = None, end_time:
 
     ---
 
-    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It creates a new client instance on every call, making it best for single, convenient operations. For making multiple API calls, instantiate and use a SensorsClient object directly for better performance.
+    **Note:** This is a functional wrapper for its equivalent method in the SensorsClient. It reuses a shared client instance created on first use, so repeated calls do not repeat client setup. To use a different API key or token manager, instantiate and use a SensorsClient object directly.
     """
-    return SensorsClient().get_sensor_data(device_id, start_time, end_time, page_size, page_token, fields, interval)
+    return _default_client().get_sensor_data(device_id, start_time, end_time, page_size, page_token, fields, interval)
@@ -6,6 +6,10 @@ from pykada.verkada_requests import VerkadaRequestManager, \
 
 
 class BaseClient:
+    # Subclasses that declare their own __slots__ get instances without a
+    # per-instance __dict__.
+    __slots__ = ("_request_manager",)
+
     def __init__(self,
                  api_key: Optional[str] = None,
                  token_manager: Optional[VerkadaTokenManager] = None,
@@ -1,6 +1,11 @@
+import asyncio
 import copy
+import json
+import os
 import time
 import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 import requests
@@ -9,6 +14,12 @@ from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 from pykada.api_tokens import get_default_token_manager, VerkadaTokenManager
+from pykada.helpers import TTLCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
 
@@ -16,6 +27,86 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_TRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
 DEFAULT_RETRY_DELAY = 0.1
+# Number of per-host connection pools a session keeps, and the number of
+# connections kept open to each host. The pool size leaves room for the
+# concurrent batch helpers and pagination prefetch without connections being
+# discarded and re-opened.
+DEFAULT_POOL_CONNECTIONS = 20
+DEFAULT_POOL_MAXSIZE = 50
+
+# Opt-in in-memory cache of GET responses, mostly useful for repeated
+# dev/testbed runs that refetch the same pages. Set PYKADA_HTTP_CACHE=1 to
+# enable it; PYKADA_HTTP_CACHE_TTL sets how many seconds responses are kept.
+HTTP_CACHE_ENABLED = os.environ.get("PYKADA_HTTP_CACHE", "").lower() \
+    not in ("", "0", "false", "no")
+HTTP_CACHE_TTL = float(os.environ.get("PYKADA_HTTP_CACHE_TTL", 300))
+
+# Bounds on the (ETag, body) entries kept for conditional GET requests. The
+# default request manager lives for the whole process, so entries for old
+# page tokens and filters must not pile up.
+ETAG_CACHE_MAXSIZE = 256
+ETAG_CACHE_TTL = 3600
+
+# Suffixes of the response keys that hold the next page token, used to infer
+# next_token_key when iterating paginated results
+PAGE_TOKEN_KEY_SUFFIXES = ("_token", "_cursor")
+
+def _dumps_json(payload) -> bytes:
+    """
+    Serialize a request payload to JSON bytes, using orjson when it is
+    installed and the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":"),
+                      allow_nan=False).encode("utf-8")
+
+def _loads_json(content: bytes):
+    """
+    Parse a JSON response body, using orjson when it is installed and the
+    standard library otherwise. Raises ValueError if content is not valid
+    JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _params_cache_key(url: str, params: Optional[dict]) -> Optional[tuple]:
+    """
+    Returns a hashable cache key for a request's url and params, or None if
+    a param value (e.g. a list) can't be hashed.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+@lru_cache(maxsize=None)
+def _shared_session(max_retries, backoff_factor, pool_connections,
+                    pool_maxsize) -> Session:
+    """
+    Returns the Session for the given retry and pool settings, creating it
+    with the retry policy and connection pool sizes mounted for http and
+    https on first use. Managers with the same settings share one Session
+    and its connection pool.
+    """
+    # Configure retries with exponential backoff
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          max_retries=retry_strategy)
+
+    session = Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 class VerkadaRequestManager:
     """
@@ -28,7 +119,10 @@ class VerkadaRequestManager:
                  backoff_factor=DEFAULT_MAX_TRIES,
                  retry_delay_seconds=DEFAULT_RETRY_DELAY,
                  token_manager:Optional[VerkadaTokenManager] = None,
-                 api_key: Optional[str] = None):
+                 api_key: Optional[str] = None,
+                 session: Optional[Session] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE):
         """
         Initialize the RequestManager with customizable parameters.
 
@@ -36,12 +130,32 @@ class VerkadaRequestManager:
         :param max_retries: Maximum number of retries for failed requests.
         :param backoff_factor: Backoff multiplier for exponential backoff.
         :param token_manager: Optional token manager for authentication.
+        :param session: Optional requests Session to send requests with. If
+            not provided, a Session with the retry policy mounted is used.
+            That Session is shared by every manager with the same retry and
+            pool settings, so connections (and TLS handshakes) are reused
+            across calls and across clients.
+        :param pool_connections: Number of per-host connection pools kept by
+            the created session. Ignored if session is provided.
+        :param pool_maxsize: Maximum number of connections kept open to each
+            host by the created session. Ignored if session is provided.
         """
         self.timeout = timeout_seconds
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.token_manager = token_manager if token_manager else get_default_token_manager()
         self.retry_delay_seconds = retry_delay_seconds
+        # Maps (url, sorted params) to the last (ETag, body) seen for
+        # conditional GET requests.
+        self._etag_cache = TTLCache(maxsize=ETAG_CACHE_MAXSIZE,
+                                    ttl=ETAG_CACHE_TTL)
+        # GET response bodies by (url, sorted params), if HTTP_CACHE_ENABLED
+        self._response_cache = TTLCache(maxsize=1024, ttl=HTTP_CACHE_TTL) \
+            if HTTP_CACHE_ENABLED else None
+        self._session = session if session is not None else _shared_session(
+            max_retries, backoff_factor, pool_connections, pool_maxsize)
 
         if token_manager and api_key:
             raise ValueError(
@@ -65,12 +179,30 @@ class VerkadaRequestManager:
         # If no token manager or api_key is provided,
         # use the default token manager
         if not self.token_manager and not api_key:
-            print("Using default token manager from environment configuration.")
+            logging.info("Using default token manager from environment configuration.")
             self.token_manager = get_default_token_manager()
 
+    @property
+    def session(self) -> Session:
+        """
+        Returns the Session used to send requests.
+        """
+        return self._session
+
+    def close(self):
+        """
+        Close the underlying Session and release its pooled connections, and
+        drop any cached response bodies. A shared Session stays usable and
+        opens new connections on its next request.
+        """
+        self._etag_cache.clear()
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        self._session.close()
+
     def _send_request(self, method: str, url: str, payload=None, headers=None,
                       params=None,
-                      return_json=True, files=None):
+                      return_json=True, files=None, conditional=False):
         """
         Centralized request handler for all HTTP methods with retry functionality.
 
@@ -80,8 +212,23 @@ class VerkadaRequestManager:
         :param payload: JSON payload for POST/PATCH requests.
         :param headers: Additional HTTP headers.
         :param params: URL parameters.
+        :param conditional: If True, send If-None-Match with the last ETag
+            seen for this url and params, and return the cached body when
+            the server answers 304 Not Modified.
         :return: JSON response object or raw content.
         """
+        response_cache_key = None
+        if self._response_cache is not None:
+            if method == "get" and return_json and not conditional:
+                response_cache_key = _params_cache_key(url, params)
+                cached_body = self._response_cache.get(response_cache_key) \
+                    if response_cache_key is not None else None
+                if cached_body is not None:
+                    return copy.deepcopy(cached_body)
+            elif method != "get":
+                # Any write may change what the cached GETs would return
+                self._response_cache.clear()
+
         # Merge default headers with user-provided headers
         merged_headers = headers or {}
         if return_json:
@@ -91,58 +238,78 @@ class VerkadaRequestManager:
         if "x-verkada-auth" not in merged_headers:
             merged_headers["x-verkada-auth"] = self.token_manager.get_token()
 
-        print(merged_headers)
-
-        # Configure retries with exponential backoff
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=self.backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        cache_key = None
+        cached = None
+        if conditional:
+            cache_key = _params_cache_key(url, params)
+            cached = self._etag_cache.get(cache_key) \
+                if cache_key is not None else None
+            if cached:
+                merged_headers["If-None-Match"] = cached[0]
+
+        # Serialize JSON bodies ourselves so the faster encoder is used when
+        # available. Multipart requests leave the payload to requests.
+        data = None
+        json_payload = payload
+        if payload is not None and not files:
+            data = _dumps_json(payload)
+            json_payload = None
+            if not any(key.lower() == "content-type" for key in merged_headers):
+                merged_headers["content-type"] = "application/json"
+
+        try:
+            logging.info(
+                "Sending %s request to %s with params: %s, payload: %s, "
+                "and files: %s", method.upper(), url, params, payload, files
+            )
+            # Reuse the manager's session so pooled connections survive
+            # across calls
+            response = self._session.request(
+                method=method,
+                url=url,
+                headers=merged_headers,
+                data=data,
+                json=json_payload,
+                params=params,
+                timeout=self.timeout,
+                files=files,
+                allow_redirects=False
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logging.error("%s request to %s failed: %s", method.upper(), url, e)
+            raise
 
-        # Use a session to apply retry logic and ensure proper resource management
-        with Session() as session:
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
+        # Nothing changed since the last fetch, reuse the cached body
+        if cached and response.status_code == 304:
+            return copy.deepcopy(cached[1])
 
+        # Parse and return the response
+        if return_json:
             try:
-                logging.info(
-                    f"Sending {method.upper()} request to {url} with params: {params}, "
-                    f"payload: {payload}, and files: {files}"
-                )
-                response = session.request(
-                    method=method,
-                    url=url,
-                    headers=merged_headers,
-                    json=payload,
-                    params=params,
-                    timeout=self.timeout,
-                    files=files,
-                    allow_redirects=False
-                )
-                response.raise_for_status()
-            except requests.exceptions.RequestException as e:
-                logging.error(f"{method.upper()} request to {url} failed: {e}")
+                body = _loads_json(response.content)
+            except ValueError:
+                logging.error("Response content is not valid JSON")
                 raise
 
-            # Parse and return the response
-            if return_json:
-                try:
-                    return response.json()
-                except ValueError:
-                    logging.error("Response content is not valid JSON")
-                    raise
-            else:
-                return response.content
-
-    def get(self, url:str, headers:dict=None, params:dict=None):
+            if response_cache_key is not None:
+                self._response_cache.set(response_cache_key, copy.deepcopy(body))
+
+            etag = response.headers.get("ETag")
+            if cache_key is not None and etag:
+                self._etag_cache.set(cache_key, (etag, copy.deepcopy(body)))
+            return body
+        else:
+            return response.content
+
+    def get(self, url:str, headers:dict=None, params:dict=None,
+            conditional: bool = False):
         return self._send_request(method="get",
                                   url=url,
                                   headers=headers,
                                   params=params,
-                                  return_json=True)
+                                  return_json=True,
+                                  conditional=conditional)
 
     def get_image(self, url, headers=None, params=None):
         return self._send_request(method="get", url=url, headers=headers, params=params, return_json=False)
@@ -199,7 +366,9 @@ class VerkadaRequestManager:
         initial_params: Optional[dict]=None,
         next_token_key: Optional[str] = None,
         default_page_size: Optional[int] = 100,
-        request_delay_seconds: Optional[float] = 0
+        request_delay_seconds: Optional[float] = 0,
+        limit: Optional[int] = None,
+        prefetch: bool = False
     ) -> typing.Generator[typing.Any, None, None]:
         """
         Iterates through all pages of results from a paginated function.
@@ -212,23 +381,46 @@ class VerkadaRequestManager:
                             'next_token_key'.
             initial_params: A dictionary of parameters for the *first* API call,
                             excluding 'page_size' and 'page_token'. This dict
-                            will be deep copied before use.
+                            is shallow copied before use; nested values are
+                            shared with the caller but never modified.
             items_key: The key in the response dictionary that contains the list
                        of items for the current page (e.g., 'alerts', 'items', 'data').
             next_token_key: The key in the response dictionary that contains the
                             token for the next page (e.g., 'next_page_token',
                             'page_token'). Should be None when there are no more pages.
+                            If not provided, it is inferred from the only
+                            response key ending in '_token' or '_cursor'.
             default_page_size: The page size to use if not specified in initial_params.
             request_delay_seconds: Optional delay in seconds between fetching pages.
+            limit: Optional maximum number of items to yield. Once reached, no
+                   further pages are requested.
+            prefetch: If True, request the next page on a background thread
+                      while the current page's items are being consumed, so
+                      at most one page is queued ahead. The thread is only
+                      started once a second page exists. paginated_func must
+                      be safe to call from another thread, and a page may be
+                      requested that the caller never consumes if it stops
+                      early. Ignored when request_delay_seconds is set.
 
         Yields:
             Each individual item from the paginated results across all pages.
+
+        Note:
+            Verkada's list endpoints use cursor pagination: each page's token
+            comes from the previous response, so pages cannot be requested in
+            parallel. prefetch is the only overlap available, fetching one
+            page ahead while the current one is consumed.
         """
+        if limit is not None and limit <= 0:
+            return
         if initial_params is None:
             initial_params = {}
+        yielded = 0
         current_page_token: typing.Optional[str] = None
-        # Start with a deep copy of initial_params to avoid modifying the original
-        params = copy.deepcopy(initial_params)
+        # Copy initial_params to avoid modifying the original. Only top-level
+        # scalar keys (page_size, page_token) are ever written, so a shallow
+        # copy is enough.
+        params = dict(initial_params)
 
         # Set default page size if not provided in initial_params or is None
         if 'page_size' not in params or params['page_size'] is None:
@@ -237,67 +429,184 @@ class VerkadaRequestManager:
         # Ensure page_token is initially absent or None, it will be added/updated below
         params.pop('page_token', None)
 
-        while True:
-            # Add or update page_token for the current iteration's request
-            # On the first loop, current_page_token is None, which is correct for the first page
-            params['page_token'] = current_page_token
-
-            # Call the wrapped function to get the current page
-            try:
-                response = paginated_func(**params)
-            except Exception as e:
-                # Handle potential exceptions from the wrapped function (e.g., network errors, API errors)
-                # You might want more specific error handling or retry logic here
-                print(f"Error fetching page with token {current_page_token}: {e}")
-                raise # Re-raise the exception
-
-            # Validate the response structure
-            if not isinstance(response, dict):
-                 print(f"Warning: Paginated function did not return a dictionary. Response: {response}")
-                 break # Stop iteration if response is unexpected
-
-            response_keys = list(response.keys())
-            if not next_token_key and len(response_keys):
-                potential_next_token_keys = [string for string in response_keys if "token" in string]
-                if len(potential_next_token_keys) == 1:
-                    next_token_key = potential_next_token_keys[0]
-
-            if not next_token_key:
-                raise ValueError("next_token_key was not provided and could "
-                                 "not be inferred from response")
-
-            if not items_key and len(response_keys) == 2:
-                potential_items_key = [string for string in response_keys if "token" not in string]
-                if len(potential_items_key) == 1:
-                    items_key = potential_items_key[0]
-
-            if not items_key:
-                raise ValueError("next_token_key was not provided and could "
-                                 "not be inferred from response")
-
-            # Extract items and the next page token using the provided keys
-            items = response.get(items_key, [])
+        # Fetch at most one page ahead on a single worker thread, started
+        # when the first next page token arrives
+        prefetch = prefetch and not request_delay_seconds
+        executor: Optional[ThreadPoolExecutor] = None
+        pending_page: Optional[Future] = None
 
-            next_page_token_from_response = response.get(next_token_key)
+        try:
+            while True:
+                # Add or update page_token for the current iteration's request
+                # On the first loop, current_page_token is None, which is correct for the first page
+                params['page_token'] = current_page_token
 
-            # Yield items from the current page
-            for item in items:
-                yield item
+                # Call the wrapped function to get the current page, or collect
+                # the page that was already requested in the background
+                try:
+                    if pending_page is not None:
+                        response = pending_page.result()
+                        pending_page = None
+                    else:
+                        response = paginated_func(**params)
+                except Exception as e:
+                    # Handle potential exceptions from the wrapped function (e.g., network errors, API errors)
+                    # You might want more specific error handling or retry logic here
+                    logging.warning("Error fetching page with token %s: %s",
+                                    current_page_token, e)
+                    raise # Re-raise the exception
+
+                # Validate the response structure
+                if not isinstance(response, dict):
+                     logging.warning("Paginated function did not return a "
+                                     "dictionary. Response: %s", response)
+                     break # Stop iteration if response is unexpected
+
+                # Infer any missing keys from the first response; every page
+                # has the same shape, so later pages skip this
+                if not (next_token_key and items_key):
+                    # Split the keys into page token keys and the rest in a
+                    # single pass
+                    potential_next_token_keys = []
+                    potential_items_key = []
+                    for key in response:
+                        if key.endswith(PAGE_TOKEN_KEY_SUFFIXES):
+                            potential_next_token_keys.append(key)
+                        else:
+                            potential_items_key.append(key)
+
+                    if not next_token_key and len(potential_next_token_keys) == 1:
+                        next_token_key = potential_next_token_keys[0]
+
+                    if not next_token_key:
+                        raise ValueError("next_token_key was not provided and could "
+                                         "not be inferred from response")
+
+                    if not items_key and len(response) == 2 \
+                            and len(potential_items_key) == 1:
+                        items_key = potential_items_key[0]
+
+                    if not items_key:
+                        raise ValueError("items_key was not provided and could "
+                                         "not be inferred from response")
+
+                # Extract items and the next page token using the provided keys
+                items = response.get(items_key, [])
+
+                next_page_token_from_response = response.get(next_token_key)
+
+                # Start fetching the next page before handing out this one,
+                # unless the limit will be reached within this page
+                if prefetch and next_page_token_from_response is not None \
+                        and (limit is None or yielded + len(items) < limit):
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1)
+                    pending_page = executor.submit(
+                        paginated_func,
+                        **{**params, 'page_token': next_page_token_from_response})
+
+                # Yield items from the current page
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+
+                # Update the page token for the next iteration
+                current_page_token = next_page_token_from_response
+
+                # Check if there are more pages. If the next token is None, we are done.
+                if current_page_token is None:
+                    break
+
+                # Optional: Wait before making the next request
+                if request_delay_seconds > 0:
+                    time.sleep(request_delay_seconds)
+        finally:
+            # Drop any page still queued if the caller stopped early
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-            # Update the page token for the next iteration
-            current_page_token = next_page_token_from_response
+    @staticmethod
+    async def aiterate_paginated_results(
+        paginated_func: typing.Callable[..., dict],
+        items_key: str,
+        next_token_key: str,
+        initial_params: Optional[dict] = None,
+        default_page_size: Optional[int] = 100,
+        limit: Optional[int] = None
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        """
+        Asynchronously iterates through all pages of results from a paginated
+        function. Async counterpart of iterate_paginated_results.
 
-            # Check if there are more pages. If the next token is None, we are done.
-            if current_page_token is None:
-                break
+        Each page request runs in a worker thread, so the event loop stays
+        free and several paginations can be consumed concurrently. The next
+        page is requested as soon as its token is known, while the current
+        page's items are being consumed.
 
-            # Optional: Wait before making the next request
-            if request_delay_seconds > 0:
-                time.sleep(request_delay_seconds)
+        Args:
+            paginated_func: The blocking function that fetches a single page
+                            of results. It is called with the params as
+                            keyword arguments, including 'page_size' and
+                            'page_token'.
+            items_key: The key in the response dictionary that contains the
+                       list of items for the current page.
+            next_token_key: The key in the response dictionary that contains
+                            the token for the next page.
+            initial_params: A dictionary of parameters for every API call,
+                            excluding 'page_token'.
+            default_page_size: The page size to use if not specified in
+                               initial_params.
+            limit: Optional maximum number of items to yield. Once reached, no
+                   further pages are requested.
 
+        Yields:
+            Each individual item from the paginated results across all pages.
+        """
+        if limit is not None and limit <= 0:
+            return
+        params = dict(initial_params or {})
+        if params.get('page_size') is None:
+            params['page_size'] = default_page_size
+
+        def fetch_page(page_token):
+            return paginated_func(**{**params, 'page_token': page_token})
+
+        yielded = 0
+        pending_page = asyncio.ensure_future(asyncio.to_thread(fetch_page, None))
+        try:
+            while pending_page is not None:
+                response = await pending_page
+                pending_page = None
+
+                items = response.get(items_key, [])
+                next_page_token = response.get(next_token_key)
+                # Start fetching the next page before handing out this one,
+                # unless the limit will be reached within this page
+                if next_page_token is not None \
+                        and (limit is None or yielded + len(items) < limit):
+                    pending_page = asyncio.ensure_future(
+                        asyncio.to_thread(fetch_page, next_page_token))
+
+                for item in items:
+                    yield item
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+        finally:
+            # Don't leave a page request running if the caller stopped early
+            if pending_page is not None:
+                pending_page.cancel()
+
+@lru_cache(maxsize=1)
 def get_default_request_manager() -> VerkadaRequestManager:
     """
     Returns a default request manager instance using the default token manager.
     This is useful for quick access without needing to instantiate a new manager.
+
+    The manager is created on first use and shared afterwards, so every
+    client built without its own credentials sends requests through the same
+    Session and reuses its pooled connections.
     """
     return VerkadaRequestManager(token_manager=get_default_token_manager())